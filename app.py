@@ -1,24 +1,36 @@
-from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, session, g
-from flask_socketio import SocketIO, emit
+from flask import Flask, Response, stream_with_context, render_template, request, jsonify, redirect, url_for, flash, session, g, send_from_directory
+from flask_socketio import SocketIO, emit, join_room
 from flask_login import LoginManager, UserMixin, login_user, logout_user, login_required, current_user
 from flask_wtf import FlaskForm, CSRFProtect
-from flask_wtf.csrf import CSRFError
+from flask_wtf.csrf import CSRFError, generate_csrf
 from wtforms import StringField, PasswordField, SubmitField
 from wtforms.validators import DataRequired
 import bcrypt
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 import os
-from config import get_config, get_int_config, get_bool_config, reload_config  # Centralized configuration
 import sqlite3
-from datetime import datetime
+import shutil  # token.env backup copy
+import tempfile  # Atomic token.env rewrite
+from config import get_config, get_int_config, get_bool_config, reload_config  # Centralized configuration
+from datetime import datetime, timedelta
 import json
-from functools import lru_cache
-import gc  # For memory management
+from functools import lru_cache, wraps
+from types import MappingProxyType  # Read-only module-level lookup tables
+import gc  # For garbage collector tuning
 import logging
+from logging.handlers import QueueHandler, QueueListener, MemoryHandler
+import queue
+import collections  # Console log buffer, bounded response cache
+import atexit
 import re  # For log sanitization
+import string  # For secret key character classes
 import secrets  # For secure random key generation
-import hashlib  # For key strength validation
+try:
+    import orjson  # Fast JSON serialization for hot API endpoints
+except ImportError:
+    orjson = None
 
 # Import bot modules (with error handling for missing API keys)
 import database
@@ -26,33 +38,90 @@ from database import validate_table_name
 
 # Security-aware logging system
 def setup_secure_logging():
-    """Setup secure logging with sanitization"""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler('logs/security.log', mode='a', encoding='utf-8')
-        ] if os.path.exists('logs') or os.makedirs('logs', exist_ok=True) else [logging.StreamHandler()]
-    )
+    """Setup secure logging with sanitization
+    
+    Records are handed to a QueueHandler so request threads only enqueue;
+    a background QueueListener does the console/file I/O. File writes are
+    batched through a MemoryHandler (flushed at 256 records, on any WARNING
+    or above so security events land on disk immediately, and at exit).
+    """
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
+    handlers = [console_handler]
+    file_buffer = None
+    try:
+        os.makedirs('logs', exist_ok=True)
+        file_handler = logging.FileHandler('logs/security.log', mode='a', encoding='utf-8')
+        file_handler.setFormatter(formatter)
+        file_buffer = MemoryHandler(capacity=256, flushLevel=logging.WARNING, target=file_handler)
+        handlers.append(file_buffer)
+    except OSError as e:
+        print(f"[WARNING] Could not create security log file: {e}")
+    
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    if file_buffer is not None:
+        atexit.register(file_buffer.flush)  # Runs after listener.stop (atexit is LIFO)
+    atexit.register(listener.stop)
+    # Threads do not survive fork (gunicorn preload_app) - restart the listener in the child
+    if hasattr(os, 'register_at_fork'):
+        os.register_at_fork(after_in_child=listener.start)
+    
+    # QueueHandler pre-formats records; keep it to the bare message so the
+    # listener's handlers apply the real format exactly once
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
     return logging.getLogger(__name__)
 
 # Initialize secure logger
 secure_logger = setup_secure_logging()
 
+# Log sanitization patterns, compiled once at import
+_SENSITIVE_KEYS = frozenset((
+    'api_key', 'api_secret', 'access_token', 'access_token_secret',
+    'bearer_token', 'gemini_api_key', 'password', 'secret', 'token'
+))
+_SENSITIVE_RE = re.compile('|'.join(map(re.escape, sorted(_SENSITIVE_KEYS))))
+_SANITIZE_APIKEY_KEYWORDS = ('api_key', 'secret', 'token', 'password')
+_SANITIZE_APIKEY_RE = re.compile(r'(api_key|secret|token|password)[=:]\s*[^\s,}]+', re.IGNORECASE)
+_SANITIZE_BEARER_RE = re.compile(r'Bearer\s+[A-Za-z0-9_%-]+')
+_SANITIZE_LONGTOKEN_RE = re.compile(r'[A-Za-z0-9_-]{20,}')
+
+def _mask_long_token(match):
+    """Mask a long token-like match, keeping only its last 4 characters"""
+    token = match.group()
+    return f"***{token[-4:]}***" if len(token) > 10 else "***REDACTED***"
+
+def _sanitize_string(data):
+    """Redact API keys, bearer tokens and long token-like strings"""
+    # Cheap substring checks skip the regex engine for the common no-secret log line
+    sanitized = data
+    lowered = data.lower()
+    if any(keyword in lowered for keyword in _SANITIZE_APIKEY_KEYWORDS):
+        sanitized = _SANITIZE_APIKEY_RE.sub(r'\1=***REDACTED***', sanitized)
+    if 'Bearer' in sanitized:
+        sanitized = _SANITIZE_BEARER_RE.sub('Bearer ***REDACTED***', sanitized)
+    if len(sanitized) >= 20:
+        sanitized = _SANITIZE_LONGTOKEN_RE.sub(_mask_long_token, sanitized)
+    return sanitized
+
 def sanitize_for_logging(data):
     """
     Sanitize sensitive data before logging
     Returns sanitized string safe for logging
     """
+    # Checks ordered by frequency: plain strings and None are the common case
+    if type(data) is str:
+        return _sanitize_string(data)
+    if data is None:
+        return data
     if isinstance(data, dict):
-        sensitive_keys = [
-            'api_key', 'api_secret', 'access_token', 'access_token_secret', 
-            'bearer_token', 'gemini_api_key', 'password', 'secret', 'token'
-        ]
         sanitized = {}
         for key, value in data.items():
-            if any(sensitive_key in key.lower() for sensitive_key in sensitive_keys):
+            if _SENSITIVE_RE.search(key.lower()):
                 if value:
                     sanitized[key] = f"***{value[-4:] if len(str(value)) > 4 else '****'}***"
                 else:
@@ -63,56 +132,74 @@ def sanitize_for_logging(data):
     elif isinstance(data, (list, tuple)):
         return [sanitize_for_logging(item) for item in data]
     elif isinstance(data, str):
-        # Sanitize known sensitive patterns
-        patterns = [
-            (r'(api_key|secret|token|password)[=:]\s*[^\s,}]+', r'\1=***REDACTED***'),
-            (r'Bearer\s+[A-Za-z0-9_%-]+', r'Bearer ***REDACTED***'),
-            (r'[A-Za-z0-9_-]{20,}', lambda m: f"***{m.group()[-4:]}***" if len(m.group()) > 10 else "***REDACTED***")
-        ]
-        sanitized = data
-        for pattern, replacement in patterns:
-            if callable(replacement):
-                sanitized = re.sub(pattern, replacement, sanitized)
-            else:
-                sanitized = re.sub(pattern, replacement, sanitized)
-        return sanitized
+        # str subclasses
+        return _sanitize_string(data)
     else:
         return data
 
+# Level name -> logging level lookup for secure_log
+_LOG_LEVELS = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL
+}
+
+def setup_runtime_logging(logger):
+    """Give the runtime logger its own console-only queue path
+    
+    Its records (generated tweet text, trend fetches) are not security
+    events, so propagate is turned off to keep them out of security.log.
+    """
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    runtime_queue = queue.Queue(-1)
+    listener = QueueListener(runtime_queue, console_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    if hasattr(os, 'register_at_fork'):
+        os.register_at_fork(after_in_child=listener.start)
+    
+    queue_handler = QueueHandler(runtime_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(queue_handler)
+    logger.propagate = False
+    return logger
+
+# Runtime/diagnostic logger for hot paths - LOG_LEVEL=WARNING silences per-request chatter in production
+log = setup_runtime_logging(logging.getLogger(f"{__name__}.runtime"))
+log.setLevel(_LOG_LEVELS.get(get_config("LOG_LEVEL", "INFO").upper(), logging.INFO))
+
 def secure_log(level, message, data=None):
     """
     Log messages with automatic sanitization of sensitive data
+    Sanitization and formatting are skipped when the level is disabled
     """
+    log_level = _LOG_LEVELS.get(level.upper(), logging.INFO)
+    if not secure_logger.isEnabledFor(log_level):
+        return
+    
     if data is not None:
-        sanitized_data = sanitize_for_logging(data)
-        message = f"{message}: {sanitized_data}"
-    
-    if level.upper() == 'DEBUG':
-        secure_logger.debug(message)
-    elif level.upper() == 'INFO':
-        secure_logger.info(message)
-    elif level.upper() == 'WARNING':
-        secure_logger.warning(message)
-    elif level.upper() == 'ERROR':
-        secure_logger.error(message)
-    elif level.upper() == 'CRITICAL':
-        secure_logger.critical(message)
+        secure_logger.log(log_level, '%s: %s', message, sanitize_for_logging(data))
     else:
-        secure_logger.info(message)
-
-# Analytics memory management
-_analytics_cleanup_counter = 0
-_analytics_cleanup_interval = 100  # Run cleanup every 100 analytics requests
-
-def analytics_memory_cleanup():
-    """Periodic memory cleanup for analytics functions"""
-    global _analytics_cleanup_counter
-    _analytics_cleanup_counter += 1
-    
-    if _analytics_cleanup_counter >= _analytics_cleanup_interval:
-        gc.collect()  # Force garbage collection
-        _analytics_cleanup_counter = 0
-        secure_log('info', f"Analytics memory cleanup performed (every {_analytics_cleanup_interval} requests)")
+        secure_logger.log(log_level, message)
+
+# Garbage collector tuning - raise the young-generation threshold once at
+# startup instead of forcing full collections from request handlers
+gc.set_threshold(700 * 4, 10, 10)
+
+# Secret key strength lookup tables
+_UPPER_CHARS = frozenset(string.ascii_uppercase)
+_LOWER_CHARS = frozenset(string.ascii_lowercase)
+_DIGIT_CHARS = frozenset(string.digits)
+_SPECIAL_CHARS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+_WEAK_PATTERNS = (
+    "secret", "password", "key", "twitter", "bot", "flask",
+    "123456", "abcdef", "qwerty", "admin", "test", "default"
+)
+# Lookahead alternation so overlapping patterns are all reported
+_WEAK_PATTERN_RE = re.compile('(?=(' + '|'.join(map(re.escape, _WEAK_PATTERNS)) + '))')
 
 def validate_secret_key_strength(key):
     """
@@ -131,11 +218,12 @@ def validate_secret_key_strength(key):
     if len(key) >= 64:
         score += 1
         
-    # Character variety check
-    has_upper = any(c.isupper() for c in key)
-    has_lower = any(c.islower() for c in key)
-    has_digit = any(c.isdigit() for c in key)
-    has_special = any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in key)
+    # Character variety check (single pass to build the character set)
+    chars = set(key)
+    has_upper = not _UPPER_CHARS.isdisjoint(chars)
+    has_lower = not _LOWER_CHARS.isdisjoint(chars)
+    has_digit = not _DIGIT_CHARS.isdisjoint(chars)
+    has_special = not _SPECIAL_CHARS.isdisjoint(chars)
     
     variety_count = sum([has_upper, has_lower, has_digit, has_special])
     
@@ -145,19 +233,14 @@ def validate_secret_key_strength(key):
         score += variety_count
     
     # Common/weak patterns check
-    weak_patterns = [
-        "secret", "password", "key", "twitter", "bot", "flask",
-        "123456", "abcdef", "qwerty", "admin", "test", "default"
-    ]
-    
-    key_lower = key.lower()
-    for pattern in weak_patterns:
-        if pattern in key_lower:
+    found_patterns = set(_WEAK_PATTERN_RE.findall(key.lower()))
+    for pattern in _WEAK_PATTERNS:
+        if pattern in found_patterns:
             issues.append(f"Secret key contains weak pattern: '{pattern}'")
             score -= 1
     
     # Entropy check (simplified)
-    unique_chars = len(set(key))
+    unique_chars = len(chars)
     if unique_chars < len(key) * 0.5:  # Less than 50% unique characters
         issues.append("Secret key has low entropy (too many repeated characters)")
     else:
@@ -170,18 +253,8 @@ def validate_secret_key_strength(key):
 
 def generate_secure_secret_key():
     """Generate a cryptographically secure secret key"""
-    # Generate 64 random bytes and convert to URL-safe base64
-    random_bytes = secrets.token_bytes(64)
-    secure_key = secrets.token_urlsafe(64)
-    
-    # Add timestamp hash for additional uniqueness
-    timestamp = str(time.time()).encode()
-    timestamp_hash = hashlib.sha256(timestamp).hexdigest()[:16]
-    
-    # Combine for final key
-    final_key = f"{secure_key}-{timestamp_hash}"
-    
-    return final_key
+    # 72 random bytes (576 bits) as URL-safe base64 - 96 characters
+    return secrets.token_urlsafe(72)
 
 def setup_secure_flask_secret():
     """Setup Flask secret key with security validation"""
@@ -227,9 +300,11 @@ def setup_secure_flask_secret():
     
     return configured_key
 
+@lru_cache(maxsize=1)
 def get_safe_table_name():
     """
     Get validated table name for safe SQL operations.
+    The table name is fixed at import, so validation runs once per process.
     
     Returns:
         str: Validated table name or None if invalid
@@ -239,6 +314,27 @@ def get_safe_table_name():
         return None
     return database.tableName
 
+# Tweet table SQL built once from the validated table name
+# Note: Table name is validated against whitelist, so f-string is safe here
+_SAFE_TABLE = get_safe_table_name()
+# database.py falls back to 'tweets' for a non-whitelisted name, so this only trips on a broken whitelist
+assert _SAFE_TABLE, f"Invalid table name: {database.tableName}"
+_SQL_SELECT_UNSENT = f"SELECT tweet_text FROM {_SAFE_TABLE} WHERE id = ? AND sent = 0"
+_SQL_SELECT_ALL_UNSENT = f"SELECT id, tweet_text FROM {_SAFE_TABLE} WHERE sent = 0"
+_SQL_MARK_SENT = f"UPDATE {_SAFE_TABLE} SET sent = 1 WHERE id = ?"
+_SQL_DELETE = f"DELETE FROM {_SAFE_TABLE} WHERE id = ?"
+_SQL_COUNT = f"SELECT COUNT(*) FROM {_SAFE_TABLE}"
+_SQL_CLEAR = f"DELETE FROM {_SAFE_TABLE}"
+# Dashboard stats in one round trip; the daily count is a created_at range so the index applies.
+# The last tweet time is shifted from UTC to local time in SQL (falls back to the raw value)
+_SQL_STATS = f"""
+    SELECT
+        (SELECT tweet_text FROM {_SAFE_TABLE} ORDER BY id DESC LIMIT 1),
+        (SELECT COALESCE(datetime(created_at, ? || ' hours'), created_at) FROM {_SAFE_TABLE} ORDER BY id DESC LIMIT 1),
+        (SELECT COUNT(*) FROM {_SAFE_TABLE}),
+        (SELECT COUNT(*) FROM {_SAFE_TABLE} WHERE created_at >= ? AND created_at < ?)
+"""
+
 # Conditional imports - only import if API keys are available
 reply = None
 trend = None
@@ -256,13 +352,102 @@ except Exception as e:
     print("[INFO] Dashboard will run in configuration-only mode")
     API_MODULES_LOADED = False
 
+# API status checker, imported once instead of on every /api/check_status call
+try:
+    import check_api_status
+except Exception as e:
+    check_api_status = None
+    print(f"[WARNING] API status checker not loaded: {e}")
+
 # Load environment variables
 # Configuration loaded via centralized config module
 
+# Memoized config lookups for request handlers - cleared by refresh_config()
+@lru_cache(maxsize=256)
+def _cfg(key, default=None):
+    """Cached get_config for hot request paths"""
+    return get_config(key, default)
+
+@lru_cache(maxsize=64)
+def _cfg_int(key, default=0):
+    """Cached get_int_config for hot request paths"""
+    return get_int_config(key, default)
+
+def _parse_sleep_hours(raw):
+    """Parse SLEEP_HOURS ("1,3,9,10" or "[1, 3, 9, 10]") into a tuple of ints"""
+    # Remove brackets if present
+    if raw.startswith('['):
+        raw = raw.strip('[]')
+    try:
+        return tuple(int(x.strip()) for x in raw.split(","))
+    except ValueError:
+        return (1, 3, 9, 10)  # Default values
+
+class _RuntimeConfig:
+    """Snapshot of config values used by request handlers - refreshed by refresh_config()"""
+    
+    __slots__ = (
+        'web_port', 'web_host', 'web_debug', 'workers',
+        'admin_users', 'admin_password_hash', 'gemini_model', 'gemini_api_key',
+        'sleep_hours'
+    )
+    
+    def __init__(self):
+        self.load()
+    
+    def load(self):
+        """Read all values from the centralized config in one go"""
+        self.web_port = get_int_config("WEB_PORT", 5000)
+        self.web_host = get_config("WEB_HOST", "127.0.0.1")
+        self.web_debug = get_bool_config("WEB_DEBUG", False)
+        self.workers = get_config('WORKERS', '1')
+        self.admin_users = frozenset(get_config("ADMIN_USERS", "admin").split(","))
+        # Encoded once - bcrypt.checkpw needs bytes and the hash never changes at runtime
+        self.admin_password_hash = (get_config("ADMIN_PASSWORD_HASH") or "").encode('utf-8')
+        self.gemini_model = get_config("GEMINI_MODEL", "gemini-2.5-flash")
+        self.gemini_api_key = get_config("gemini_api_key")
+        self.sleep_hours = _parse_sleep_hours(get_config("SLEEP_HOURS", "1,3,9,10"))
+
+_CFG = _RuntimeConfig()
+
+def refresh_config():
+    """Reload token.env and drop every cached config value derived from it"""
+    reload_config()
+    _cfg.cache_clear()
+    _cfg_int.cache_clear()
+    _CFG.load()
+    reset_gemini_model()
+
+# Gemini model handle shared by AI enhance requests
+_gemini_model = None
+_gemini_lock = threading.Lock()
+
+def get_gemini_model():
+    """Configure Gemini once and reuse the model handle across requests"""
+    global _gemini_model
+    
+    # Quick check without lock for performance
+    if _gemini_model is not None:
+        return _gemini_model
+    
+    # Double-checked locking pattern for thread safety
+    with _gemini_lock:
+        if _gemini_model is None:
+            import google.generativeai as genai
+            genai.configure(api_key=_CFG.gemini_api_key)
+            _gemini_model = genai.GenerativeModel(_CFG.gemini_model)
+    return _gemini_model
+
+def reset_gemini_model():
+    """Drop the cached model so the next request picks up new API key/model settings"""
+    global _gemini_model
+    with _gemini_lock:
+        _gemini_model = None
+
 # Web server configuration
-WEB_PORT = get_int_config("WEB_PORT", 5000)
-WEB_HOST = get_config("WEB_HOST", "127.0.0.1")
-WEB_DEBUG = get_bool_config("WEB_DEBUG", False)
+WEB_PORT = _CFG.web_port
+WEB_HOST = _CFG.web_host
+WEB_DEBUG = _CFG.web_debug
 
 # Initialize Flask app with secure secret key
 app = Flask(__name__)
@@ -274,7 +459,7 @@ app.secret_key = setup_secure_flask_secret()
 # Multi-worker deployment is incompatible with bot state management
 def validate_single_worker_deployment():
     """Validate that we're running with exactly 1 worker for bot functionality"""
-    workers_env = get_config('WORKERS', '1')
+    workers_env = _CFG.workers
     try:
         workers = int(workers_env)
         if workers > 1:
@@ -303,22 +488,69 @@ csrf = CSRFProtect(app)
 app.config['WTF_CSRF_TIME_LIMIT'] = 3600  # 1 hour token lifetime
 app.config['WTF_CSRF_METHODS'] = ['POST', 'PUT', 'PATCH', 'DELETE']  # Methods requiring CSRF
 app.config['WTF_CSRF_HEADERS'] = ['X-CSRFToken', 'X-CSRF-Token']  # Allowed headers
+app.json.compact = True  # Never pretty-print jsonify() output, even in debug mode
 
 # SECURITY: Add secure CSRF token generation for AJAX requests
 @app.context_processor
 def inject_csrf_token():
     """Inject secure CSRF token for AJAX requests without exposing in meta tags"""
-    from flask_wtf.csrf import generate_csrf
     return dict(csrf_token=generate_csrf())
 
+# Fast JSON responses for frequently polled endpoints
+def _dumps(obj):
+    """Serialize to JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def _json(obj, status=200):
+    """Lightweight jsonify replacement for hot API endpoints"""
+    return Response(_dumps(obj), status=status, mimetype='application/json')
+
+# Short-lived, bounded response cache for polled read-only endpoints,
+# keyed on path + only the query args the view declares (random query strings can't grow it)
+RESPONSE_CACHE_TTL = 5.0  # seconds
+RESPONSE_CACHE_MAXSIZE = 16
+_response_cache = collections.OrderedDict()  # (path, args) -> (expires, tweets_generation, body, mimetype)
+_response_cache_lock = threading.Lock()
+
+def invalidate_response_cache():
+    """Drop cached polled responses after tweets are deleted, cleared or imported"""
+    with _response_cache_lock:
+        _response_cache.clear()
+
+def cached_endpoint(ttl=RESPONSE_CACHE_TTL, vary_on=()):
+    """Serve a view's successful response from memory for ttl seconds (vary_on: query args in the key)"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            key = (request.path, tuple(request.args.get(name) for name in vary_on))
+            now = time.monotonic()
+            generation = database.tweets_generation  # Bot inserts/imports also invalidate
+            cached = _response_cache.get(key)
+            if cached and now < cached[0] and cached[1] == generation:
+                return Response(cached[2], mimetype=cached[3])
+            response = app.make_response(view(*args, **kwargs))
+            if response.status_code == 200:
+                with _response_cache_lock:
+                    # Evict expired entries, then the oldest, to stay within RESPONSE_CACHE_MAXSIZE
+                    for stale in [k for k, v in _response_cache.items() if v[0] <= now]:
+                        del _response_cache[stale]
+                    _response_cache[key] = (now + ttl, generation, response.get_data(), response.mimetype)
+                    _response_cache.move_to_end(key)
+                    while len(_response_cache) > RESPONSE_CACHE_MAXSIZE:
+                        _response_cache.popitem(last=False)
+            return response
+        return wrapper
+    return decorator
+
 # SECURITY: Secure CSRF token endpoint (instead of meta tag exposure)
 @app.route('/csrf-token')
 def get_csrf_token():
     """Provide CSRF token via secure API endpoint instead of meta tag"""
     try:
-        from flask_wtf.csrf import generate_csrf
         token = generate_csrf()
-        return jsonify({
+        return _json({
             'csrf_token': token,
             'expires_in': app.config.get('WTF_CSRF_TIME_LIMIT', 3600)
         })
@@ -328,51 +560,77 @@ def get_csrf_token():
 
 # CSP nonce injection removed - using unsafe-inline for compatibility
 
-# SECURITY: Enhanced security headers with CSP nonce
+# SECURITY: Security headers built once at startup
+# Content Security Policy - Allow jQuery and other CDN sources
+_CSP_POLICY = (
+    "default-src 'self'; "
+    "script-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net https://cdnjs.cloudflare.com https://code.jquery.com; "
+    "style-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net https://cdnjs.cloudflare.com; "
+    "font-src 'self' https://cdnjs.cloudflare.com; "
+    "connect-src 'self' ws: wss:; "
+    "img-src 'self' data: https:; "
+    "base-uri 'self'; "
+    "form-action 'self'; "
+    "frame-ancestors 'none';"
+)
+
+_STATIC_SECURITY_HEADERS = {
+    'X-Frame-Options': 'DENY',  # Prevent clickjacking
+    'X-Content-Type-Options': 'nosniff',  # Prevent MIME sniffing
+    'X-XSS-Protection': '1; mode=block',  # XSS Protection
+    'Referrer-Policy': 'strict-origin-when-cross-origin',  # Referrer Policy
+    'Content-Security-Policy': _CSP_POLICY
+}
+
+_HSTS_HEADER = 'max-age=31536000; includeSubDomains; preload'
+
+# SECURITY: Enhanced security headers
 @app.after_request
 def add_security_headers(response):
     """Add comprehensive security headers"""
-    
-    # Prevent clickjacking
-    response.headers['X-Frame-Options'] = 'DENY'
-    
-    # Prevent MIME sniffing
-    response.headers['X-Content-Type-Options'] = 'nosniff'
-    
-    # XSS Protection
-    response.headers['X-XSS-Protection'] = '1; mode=block'
-    
-    # Referrer Policy
-    response.headers['Referrer-Policy'] = 'strict-origin-when-cross-origin'
+    response.headers.update(_STATIC_SECURITY_HEADERS)
     
     # HTTPS Strict Transport Security (if using HTTPS)
     if request.is_secure:
-        response.headers['Strict-Transport-Security'] = 'max-age=31536000; includeSubDomains; preload'
-    
-    # Content Security Policy - Allow jQuery and other CDN sources
-    csp_policy = (
-        "default-src 'self'; "
-        "script-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net https://cdnjs.cloudflare.com https://code.jquery.com; "
-        "style-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net https://cdnjs.cloudflare.com; "
-        "font-src 'self' https://cdnjs.cloudflare.com; "
-        "connect-src 'self' ws: wss:; "
-        "img-src 'self' data: https:; "
-        "base-uri 'self'; "
-        "form-action 'self'; "
-        "frame-ancestors 'none';"
-    )
-    response.headers['Content-Security-Policy'] = csp_policy
-    
+        response.headers['Strict-Transport-Security'] = _HSTS_HEADER
     
     return response
 
-# Initialize SocketIO for real-time updates
-socketio = SocketIO(app, cors_allowed_origins="*")
+# Request-scoped pooled database connection
+def get_request_db():
+    """Get the pooled database connection for the current request"""
+    if 'db_conn' not in g:
+        g.db_conn = database.get_pooled_connection()
+    return g.db_conn
+
+@app.teardown_appcontext
+def release_request_db(exception=None):
+    """Return the request's database connection to the pool"""
+    conn = g.pop('db_conn', None)
+    if conn is not None:
+        database.put_db_connection(conn)
+
+class _OrjsonCodec:
+    """json-module-compatible codec so Socket.IO packets are encoded with orjson"""
+    
+    @staticmethod
+    def dumps(obj, **kwargs):
+        return orjson.dumps(obj).decode('utf-8')
+    
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
+
+# Initialize SocketIO for real-time updates (orjson packet codec when installed)
+_socketio_options = {'json': _OrjsonCodec} if orjson is not None else {}
+socketio = SocketIO(app, cors_allowed_origins="*", **_socketio_options)
 
 # Global bot control variables with thread safety
 bot_thread = None
 bot_running = False
 bot_stop_event = threading.Event()  # Event for graceful thread termination
+bot_done_event = threading.Event()  # Set while no bot thread is running
+bot_done_event.set()
 bot_lock = threading.Lock()  # Thread safety for bot variables
 connected_clients = set()  # Track connected WebSocket clients
 bot_stats = {
@@ -382,6 +640,14 @@ bot_stats = {
     "total_tweets": 0,
     "bot_start_time": None
 }
+bot_start_ts = None  # Unix timestamp of bot start, formatted lazily in get_bot_stats()
+
+def get_bot_stats():
+    """Return bot stats with the start time formatted for display"""
+    stats = dict(bot_stats)
+    if bot_start_ts is not None:
+        stats["bot_start_time"] = datetime.fromtimestamp(bot_start_ts).isoformat(sep=' ', timespec='seconds')
+    return stats
 
 # User model for authentication
 class User(UserMixin):
@@ -391,8 +657,7 @@ class User(UserMixin):
 @login_manager.user_loader
 def load_user(user_id):
     # Simple user system - in production use proper database
-    admin_users = get_config("ADMIN_USERS", "admin").split(",")
-    if user_id in admin_users:
+    if user_id in _CFG.admin_users:
         return User(user_id)
     return None
 
@@ -412,8 +677,7 @@ def login():
         password = form.password.data
         
         # Secure authentication with bcrypt password hashing only
-        admin_password_hash = get_config("ADMIN_PASSWORD_HASH")
-        admin_users = get_config("ADMIN_USERS", "admin").split(",")
+        admin_password_hash = _CFG.admin_password_hash
         
         # SECURITY: Require proper bcrypt hash - no fallback to plain passwords
         if not admin_password_hash:
@@ -427,8 +691,10 @@ def login():
         
         try:
             # Test password verification
-            password_match = bcrypt.checkpw(password.encode('utf-8'), admin_password_hash.encode('utf-8'))
-            username_match = username in admin_users
+            # Always run bcrypt, even for unknown usernames, so response timing
+            # does not reveal which usernames exist
+            password_match = bcrypt.checkpw(password.encode('utf-8'), admin_password_hash)
+            username_match = username in _CFG.admin_users
         except Exception as e:
             # Log authentication errors without exposing details
             print(f"[ERROR] Authentication error: {type(e).__name__}")
@@ -459,7 +725,6 @@ def logout():
 @app.route('/favicon.ico')
 def favicon():
     """Serve favicon"""
-    from flask import send_from_directory
     return send_from_directory(os.path.join(app.root_path, 'static'), 'favicon.ico', mimetype='image/vnd.microsoft.icon')
 
 @app.route('/')
@@ -468,7 +733,7 @@ def dashboard():
     """Main dashboard page showing bot status and recent activity"""
     update_stats()
     config = get_current_config()
-    return render_template('dashboard.html', stats=bot_stats, bot_running=bot_running, config=config)
+    return render_template('dashboard.html', stats=get_bot_stats(), bot_running=bot_running, config=config)
 
 @app.route('/tweets')
 @login_required
@@ -476,18 +741,22 @@ def tweets_history():
     """Tweet history page with pagination and filtering"""
     page = request.args.get('page', 1, type=int)
     filter_type = request.args.get('filter', 'all')
+    before_id = request.args.get('before_id', type=int)
     per_page = 20
     
     # Get tweets from database with filtering
-    tweets, total_count = get_tweets_from_db(page, per_page, filter_type)
+    tweets, total_count, has_more = get_tweets_from_db(page, per_page, filter_type, before_id)
     total_pages = (total_count + per_page - 1) // per_page
+    # "Next" continues from the oldest id on this page, only when another row exists
+    next_before_id = tweets[-1][0] if has_more else None
     
     return render_template('tweets.html', 
                          tweets=tweets, 
                          page=page, 
                          total_pages=total_pages,
                          filter_type=filter_type,
-                         total_count=total_count)
+                         total_count=total_count,
+                         next_before_id=next_before_id)
 
 @app.route('/manual')
 @login_required
@@ -522,19 +791,30 @@ def prompts():
     return render_template('prompts.html')
 
 # API Endpoints
+STATUS_CACHE_TTL = 1.0  # seconds; absorbs dashboards polling every second
+_status_cache = {'running': None, 'body': None, 'expires': 0.0}
+
 @app.route('/api/status')
 def api_status():
     """Get bot current status"""
+    global _status_cache
+    cached = _status_cache
+    if cached['running'] == bot_running and time.monotonic() < cached['expires']:
+        return Response(cached['body'], mimetype='application/json')
+
     update_stats()
-    return jsonify({
-        "running": bot_running,
-        "stats": bot_stats
+    running = bot_running
+    body = _dumps({
+        "running": running,
+        "stats": get_bot_stats()
     })
+    _status_cache = {'running': running, 'body': body, 'expires': time.monotonic() + STATUS_CACHE_TTL}
+    return Response(body, mimetype='application/json')
 
 @app.route('/api/control', methods=['POST'])
 def api_control():
     """Start/stop bot control"""
-    global bot_thread, bot_running
+    global bot_thread, bot_running, bot_start_ts
     
     # Check if bot modules are loaded
     if not API_MODULES_LOADED:
@@ -552,20 +832,25 @@ def api_control():
     
     with bot_lock:
         if action == 'start' and not bot_running:
+            # A previous thread that is still finishing its cycle would keep looping once the stop signal is cleared
+            if not bot_done_event.is_set():
+                return jsonify({"success": False, "message": "Bot hâlâ duruyor, lütfen birkaç saniye sonra tekrar deneyin"})
             try:
                 # Clear any previous stop signal
                 bot_stop_event.clear()
+                bot_done_event.clear()
 
                 print(f"[INFO] Starting bot thread...")
-                bot_thread = threading.Thread(target=run_bot_thread)
-                bot_thread.daemon = True
+                # Real OS thread: the cycle's tweepy/requests/Gemini calls block, and without
+                # monkey-patching a green thread would stall every HTTP and socket client
+                bot_thread = threading.Thread(target=run_bot_thread, daemon=True)
                 bot_thread.start()
                 bot_running = True
-                bot_stats["bot_start_time"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                bot_start_ts = time.time()
                 print(f"[SUCCESS] Bot started successfully, bot_running={bot_running}")
 
-                # Broadcast status update via SocketIO
-                socketio.emit('bot_status', {'running': True, 'message': 'Bot başlatıldı'})
+                # Broadcast status update via SocketIO (off the request thread)
+                socketio.start_background_task(socketio.emit, 'bot_status', {'running': True, 'message': 'Bot başlatıldı'})
 
                 return jsonify({"success": True, "message": "Bot başlatıldı"})
             except Exception as e:
@@ -578,19 +863,16 @@ def api_control():
                 bot_running = False
                 bot_stop_event.set()  # Signal thread to stop
 
-                # Wait for thread to finish gracefully
-                if bot_thread and bot_thread.is_alive():
-                    bot_thread.join(timeout=3.0)
-
-                bot_stop_event.clear()  # Reset for future use
+                # Wait for the thread to finish gracefully (stop signal stays set until the next start)
+                bot_done_event.wait(timeout=3.0)
 
                 # Clear bot start time when stopped
-                bot_stats["bot_start_time"] = None
+                bot_start_ts = None
 
                 print(f"[SUCCESS] Bot stopped successfully, bot_running={bot_running}")
 
-                # Broadcast status update via SocketIO
-                socketio.emit('bot_status', {'running': False, 'message': 'Bot durduruldu'})
+                # Broadcast status update via SocketIO (off the request thread)
+                socketio.start_background_task(socketio.emit, 'bot_status', {'running': False, 'message': 'Bot durduruldu'})
 
                 return jsonify({"success": True, "message": "Bot durduruldu"})
             except Exception as e:
@@ -632,6 +914,48 @@ def api_manual_tweet():
     except Exception as e:
         return jsonify({"success": False, "message": f"Hata: {str(e)}"})
 
+# Active persona prompts cache for AI enhance requests
+PROMPTS_CACHE_TTL = 300  # seconds
+_prompts_cache = {'value': None, 'expires': 0.0}
+
+def get_cached_prompts():
+    """Get active prompts, hitting the database at most once per TTL window"""
+    now = time.monotonic()
+    if _prompts_cache['value'] is None or now >= _prompts_cache['expires']:
+        prompts = database.get_prompts()
+        if not prompts:
+            return prompts  # Don't cache empty/error results
+        _prompts_cache['value'] = prompts
+        _prompts_cache['expires'] = now + PROMPTS_CACHE_TTL
+    return _prompts_cache['value']
+
+def invalidate_prompts_cache():
+    """Force the next get_cached_prompts() call to reload from the database"""
+    _prompts_cache['value'] = None
+
+# Enhancement prompt templates (whitespace matches the original inline prompts)
+_ENHANCE_TMPL = """
+            {persona}
+
+            Konu: {topic}
+
+            ÖNEMLİ KURALLAR:
+            1. Oluşturacağın tweet'in karakter sayısı yukarıda yazıyor. asla aşmayacaksın!
+            2. Tweet'i kesik bırakma, tam bir cümle olsun
+            3. Emoji ve hashtag'ler de karakter sayısına dahil
+
+            Sadece tweet metnini yaz, başka hiçbir açıklama ekleme."""
+
+_ENHANCE_RETRY_TMPL = """
+            HATA: Ürettiğin tweet {length} karakter, bu çok uzun!
+
+            {persona}
+
+            Konu: {topic}
+
+            MUTLAKA 280 KARAKTERDEN KISA BİR TWEET YAZ!
+            Sadece tweet metnini döndür."""
+
 @app.route('/api/enhance', methods=['POST'])
 @login_required
 def api_enhance_tweet():
@@ -646,28 +970,15 @@ def api_enhance_tweet():
         return jsonify({"success": False, "message": "Tweet metni gerekli"}), 400
 
     try:
-        # Get persona prompt from database
-        prompts = database.get_prompts()
+        # Get persona prompt from database (cached)
+        prompts = get_cached_prompts()
         persona_prompt = prompts.get(persona, prompts.get('casual', ''))
 
         # Create enhancement prompt using persona from database
-        enhancement_prompt = f"""
-            {persona_prompt}
-
-            Konu: {original_text}
-
-            ÖNEMLİ KURALLAR:
-            1. Oluşturacağın tweet'in karakter sayısı yukarıda yazıyor. asla aşmayacaksın!
-            2. Tweet'i kesik bırakma, tam bir cümle olsun
-            3. Emoji ve hashtag'ler de karakter sayısına dahil
-
-            Sadece tweet metnini yaz, başka hiçbir açıklama ekleme."""
+        enhancement_prompt = _ENHANCE_TMPL.format(persona=persona_prompt, topic=original_text)
 
         # Use Gemini AI to enhance the tweet
-        import google.generativeai as genai
-        genai.configure(api_key=get_config("gemini_api_key"))
-
-        model = genai.GenerativeModel(get_config("GEMINI_MODEL", "gemini-2.5-flash"))
+        model = get_gemini_model()
         response = model.generate_content(enhancement_prompt)
         enhanced_text = response.text.strip()
 
@@ -679,15 +990,8 @@ def api_enhance_tweet():
         if len(enhanced_text) > 280:
             print(f"Warning: AI generated tweet longer than 280 chars: {len(enhanced_text)}")
             # Try once more with stronger emphasis
-            enhancement_prompt_retry = f"""
-            HATA: Ürettiğin tweet {len(enhanced_text)} karakter, bu çok uzun!
-
-            {persona_prompt}
-
-            Konu: {original_text}
-
-            MUTLAKA 280 KARAKTERDEN KISA BİR TWEET YAZ!
-            Sadece tweet metnini döndür."""
+            enhancement_prompt_retry = _ENHANCE_RETRY_TMPL.format(
+                length=len(enhanced_text), persona=persona_prompt, topic=original_text)
 
             response = model.generate_content(enhancement_prompt_retry)
             enhanced_text = response.text.strip()
@@ -711,89 +1015,107 @@ def api_enhance_tweet():
 def api_trends():
     """Get current trending topics"""
     trends = get_current_trends()
-    return jsonify({"trends": trends})
+    return _json({"trends": trends})
 
 @app.route('/api/retry_tweet/<int:tweet_id>', methods=['POST'])
 def api_retry_tweet(tweet_id):
     """Retry failed tweet by ID"""
     try:
-        # Validate table name first
-        safe_table = get_safe_table_name()
-        if not safe_table:
-            return jsonify({"success": False, "message": "Güvenlik hatası: Geçersiz tablo adı"})
-            
-        conn = database.get_db_connection()
+        conn = get_request_db()
         if not conn:
             return jsonify({"success": False, "message": "Veritabanı bağlantı hatası"})
             
-        try:
-            with conn:  # Auto-commit and cleanup
-                cursor = conn.cursor()
-                
-                cursor.execute(f"SELECT tweet_text FROM {safe_table} WHERE id = ? AND sent = 0", (tweet_id,))
-                tweet_data = cursor.fetchone()
-                
-                if not tweet_data:
-                    return jsonify({"success": False, "message": "Tweet bulunamadı veya zaten gönderilmiş"})
-                
-                tweet_text = tweet_data[0]
-                
-                # Try to post the tweet again
-                status = main.scheduled_tweet(tweet_text)
-                
-                if status:
-                    # Update database to mark as sent
-                    cursor.execute(f"UPDATE {safe_table} SET sent = 1 WHERE id = ?", (tweet_id,))
-                    message = "Tweet başarıyla tekrar gönderildi"
-                else:
-                    message = "Tweet tekrar gönderilemedi"
-        finally:
-            conn.close()  # Ensure connection is closed
+        with conn:  # Auto-commit
+            cursor = conn.cursor()
+            
+            cursor.execute(_SQL_SELECT_UNSENT, (tweet_id,))
+            tweet_data = cursor.fetchone()
             
-            return jsonify({"success": status, "message": message})
+            if not tweet_data:
+                return jsonify({"success": False, "message": "Tweet bulunamadı veya zaten gönderilmiş"})
+            
+            tweet_text = tweet_data[0]
+            
+            # Try to post the tweet again
+            status = main.scheduled_tweet(tweet_text)
+            
+            if status:
+                # Update database to mark as sent
+                cursor.execute(_SQL_MARK_SENT, (tweet_id,))
+                invalidate_filter_counts()
+                invalidate_response_cache()
+                message = "Tweet başarıyla tekrar gönderildi"
+            else:
+                message = "Tweet tekrar gönderilemedi"
+        
+        return jsonify({"success": status, "message": message})
             
     except Exception as e:
         return jsonify({"success": False, "message": f"Hata: {str(e)}"})
 
+class TokenBucket:
+    """Thread-safe token bucket limiting how fast tweets are posted"""
+    
+    def __init__(self, rate, capacity):
+        self.rate = rate  # Tokens added per second
+        self.capacity = capacity  # Maximum burst size
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_time = (1 - self._tokens) / self.rate
+            time.sleep(wait_time)
+
+# Retry pacing: posts start at least 2 seconds apart, as in the old sequential loop.
+# Capacity 1 means no bursts - simultaneous posts risk 429s or an account lock on X's write limits
+RETRY_MAX_WORKERS = 4
+retry_rate_limiter = TokenBucket(rate=0.5, capacity=1)
+
+def _retry_post(tweet_text):
+    """Post a single failed tweet once the rate limiter allows it"""
+    retry_rate_limiter.acquire()
+    return main.scheduled_tweet(tweet_text)
+
 @app.route('/api/bulk_retry', methods=['POST'])
 def api_bulk_retry():
     """Retry all failed tweets"""
     try:
-        conn = database.get_db_connection()
+        conn = get_request_db()
         if conn:
-            cursor = conn.cursor()
-            
-            # Get all failed tweets with validated table name
-            safe_table = get_safe_table_name()
-            if not safe_table:
-                return jsonify({"success": False, "message": "Güvenlik hatası: Geçersiz tablo adı"})
+            with conn:  # Single transaction for all status updates
+                cursor = conn.cursor()
                 
-            cursor.execute(f"SELECT id, tweet_text FROM {safe_table} WHERE sent = 0")
-            failed_tweets = cursor.fetchall()
-            
-            if not failed_tweets:
-                return jsonify({"success": False, "message": "Tekrar gönderilecek başarısız tweet bulunamadı"})
-            
-            success_count = 0
-            for tweet_id, tweet_text in failed_tweets:
-                # Try to post each failed tweet
-                status = main.scheduled_tweet(tweet_text)
+                cursor.execute(_SQL_SELECT_ALL_UNSENT)
+                failed_tweets = cursor.fetchall()
                 
-                if status:
-                    # Update database
-                    cursor.execute(f"UPDATE {safe_table} SET sent = 1 WHERE id = ?", (tweet_id,))
-                    success_count += 1
+                if not failed_tweets:
+                    return jsonify({"success": False, "message": "Tekrar gönderilecek başarısız tweet bulunamadı"})
                 
-                # Small delay between tweets to avoid rate limiting
-                time.sleep(2)
-            
-            conn.commit()
-            cursor.close()
-            conn.close()
+                # Post concurrently (I/O bound), paced by the token bucket
+                with ThreadPoolExecutor(max_workers=RETRY_MAX_WORKERS) as executor:
+                    statuses = list(executor.map(_retry_post, [tweet_text for _, tweet_text in failed_tweets]))
+                
+                # Mark every successfully posted tweet in one batch
+                sent_ids = [(tweet_id,) for (tweet_id, _), status in zip(failed_tweets, statuses) if status]
+                if sent_ids:
+                    cursor.executemany(_SQL_MARK_SENT, sent_ids)
+                    invalidate_filter_counts()
+                    invalidate_response_cache()
+                cursor.close()
             
             return jsonify({
                 "success": True, 
-                "message": f"{success_count}/{len(failed_tweets)} tweet başarıyla gönderildi"
+                "message": f"{len(sent_ids)}/{len(failed_tweets)} tweet başarıyla gönderildi"
             })
             
     except Exception as e:
@@ -803,27 +1125,14 @@ def api_bulk_retry():
 def api_delete_tweet(tweet_id):
     """Delete tweet from database"""
     try:
-        conn = database.get_db_connection()
+        conn = get_request_db()
         if conn:
-            cursor = conn.cursor()
-            
-            # Delete tweet from database with validated table name
-            safe_table = get_safe_table_name()
-            if not safe_table:
-                return jsonify({"success": False, "message": "Güvenlik hatası: Geçersiz tablo adı"})
-                
-            cursor.execute(f"DELETE FROM {safe_table} WHERE id = ?", (tweet_id,))
-            
-            if cursor.rowcount > 0:
-                conn.commit()
-                message = "Tweet veritabanından silindi"
-                success = True
-            else:
-                message = "Tweet bulunamadı"
-                success = False
-            
-            cursor.close()
-            conn.close()
+            with conn:
+                success = conn.execute(_SQL_DELETE, (tweet_id,)).rowcount > 0
+            if success:
+                invalidate_filter_counts()
+                invalidate_response_cache()
+            message = "Tweet veritabanından silindi" if success else "Tweet bulunamadı"
             
             return jsonify({"success": success, "message": message})
             
@@ -833,7 +1142,7 @@ def api_delete_tweet(tweet_id):
 @app.route('/api/debug/env', methods=['GET'])
 def debug_env_vars():
     """Debug endpoint to check current environment variables"""
-    reload_config()  # Force reload from centralized config
+    refresh_config()  # Force reload from centralized config
     
     return jsonify({
         'TRENDS_LIMIT': get_config('TRENDS_LIMIT'),
@@ -877,23 +1186,15 @@ def api_config():
             secure_log('info', f"Configuration change attempt by user {current_user.id} from IP {request.remote_addr}")
             secure_log('info', "Keys to update", list(new_config.keys()))
             
-            # Update token.env file with new configuration
-            update_token_env(new_config)
-            
-            # Reload environment variables for immediate effect
-            reload_config()
-            
-            # Broadcast configuration change to all clients
-            socketio.emit('config_updated', {
-                'message': 'Konfigürasyon güncellendi ve otomatik olarak uygulandı!',
-                'config': new_config,
-                'auto_applied': True
-            })
+            # Validate first so bad input gets a 400, then write token.env before replying
+            validated_config = validate_config_update(new_config)
+            changed_keys = apply_config_update(validated_config)
             
             return jsonify({
                 "success": True, 
                 "message": "Konfigürasyon güncellendi (tüm değerler doğrulandı)",
                 "validated_keys": list(new_config.keys()),
+                "changed_keys": changed_keys,
                 "timestamp": datetime.now().isoformat()
             })
             
@@ -923,15 +1224,13 @@ def api_emergency_stop():
     try:
         bot_running = False
         
-        # Kill bot thread if running
-        if bot_thread and bot_thread.is_alive():
-            # Force stop thread (in real implementation, use proper thread management)
-            pass
+        # Signal the bot thread to stop at its next check
+        bot_stop_event.set()
         
         # Broadcast emergency stop to all clients
         socketio.emit('emergency_stop', {
             'message': 'ACİL DURDURMA - Tüm bot işlemleri durduruldu',
-            'timestamp': datetime.now().strftime("%H:%M:%S")
+            'timestamp': time.strftime("%H:%M:%S")
         })
         
         broadcast_console_log('ERROR', 'ACİL DURDURMA YAPILDI - Bot tüm işlemleri durdurdu')
@@ -945,25 +1244,16 @@ def api_emergency_stop():
 def api_clear_database():
     """Clear all tweets from database"""
     try:
-        conn = database.get_db_connection()
+        conn = get_request_db()
         if conn:
-            cursor = conn.cursor()
-            
-            # Count existing records with validated table name
-            safe_table = get_safe_table_name()
-            if not safe_table:
-                return jsonify({"success": False, "message": "Güvenlik hatası: Geçersiz tablo adı"})
+            with conn:  # Single commit for count + delete
+                record_count = conn.execute(_SQL_COUNT).fetchone()[0]
                 
-            cursor.execute(f"SELECT COUNT(*) FROM {safe_table}")
-            record_count = cursor.fetchone()[0]
-            
-            # Clear all tweets
-            cursor.execute(f"DELETE FROM {safe_table}")
-            conn.commit()
-            
-            cursor.close()
-            conn.close()
+                # Clear all tweets
+                conn.execute(_SQL_CLEAR)
             
+            invalidate_filter_counts()
+            invalidate_response_cache()
             broadcast_console_log('WARN', f'Veritabanı temizlendi - {record_count} kayıt silindi')
             
             return jsonify({
@@ -1016,145 +1306,183 @@ def update_stats():
     """Update bot statistics from database"""
     global bot_stats
     try:
-        conn = database.get_db_connection()
+        conn = get_request_db()
         if conn:
             cursor = conn.cursor()
             
-            # Get last tweet with validated table name
-            safe_table = get_safe_table_name()
-            if not safe_table:
-                return {}
-                
-            cursor.execute(f"SELECT tweet_text, created_at FROM {safe_table} ORDER BY created_at DESC LIMIT 1")
-            last_tweet = cursor.fetchone()
-
-            if last_tweet:
-                bot_stats["last_tweet"] = last_tweet[0]
-                # Convert UTC to local time for display
-                try:
-                    from datetime import datetime
-                    import datetime as dt
-                    from config import get_int_config
-
-                    utc_time = datetime.strptime(last_tweet[1], "%Y-%m-%d %H:%M:%S")
-                    # Get timezone offset from config (default: UTC+3 for Turkey)
-                    tz_offset = get_int_config("TIMEZONE_OFFSET", 3)
-                    local_time = utc_time + dt.timedelta(hours=tz_offset)
-                    bot_stats["last_tweet_time"] = local_time.strftime("%Y-%m-%d %H:%M:%S")
-                except:
-                    bot_stats["last_tweet_time"] = last_tweet[1]
-            
-            # Get daily and total tweets count in single optimized query
-            today = datetime.now().strftime("%Y-%m-%d")
-            cursor.execute(f"""
-                SELECT 
-                    COUNT(*) as total_tweets,
-                    SUM(CASE WHEN DATE(created_at) = ? THEN 1 ELSE 0 END) as daily_tweets
-                FROM {safe_table}
-            """, (today,))
+            # Day bounds as ISO date strings compare correctly against 'YYYY-MM-DD HH:MM:SS'
+            today = datetime.now().date()
+            day_start = today.isoformat()
+            day_end = (today + timedelta(days=1)).isoformat()
+            # Timezone offset from config (default: UTC+3 for Turkey)
+            tz_offset = _cfg_int("TIMEZONE_OFFSET", 3)
+            cursor.execute(_SQL_STATS, (tz_offset, day_start, day_end))
+            last_tweet_text, last_tweet_time, total_tweets, daily_tweets = cursor.fetchone()
+
+            if last_tweet_text is not None:
+                bot_stats["last_tweet"] = last_tweet_text
+                bot_stats["last_tweet_time"] = last_tweet_time
             
-            stats_result = cursor.fetchone()
-            bot_stats["total_tweets"] = stats_result[0]
-            bot_stats["daily_tweets"] = stats_result[1]
+            bot_stats["total_tweets"] = total_tweets
+            bot_stats["daily_tweets"] = daily_tweets
             
             cursor.close()
-            conn.close()
     except Exception as e:
-        print(f"Stats update error: {e}")
+        log.error("Stats update error: %s", e)
+
+# Tweet history filters -> WHERE condition
+_TWEET_FILTERS = {
+    'all': "",
+    'success': "sent = 1",
+    'failed': "sent = 0",
+    'manual': "tweet_type = 'manual'",
+    'auto': "tweet_type = 'tweet'"
+}
+
+# Per-filter page and count SQL, built once so sqlite3 reuses its cached statements
+_SQL_PAGE_BASE = f"""
+    SELECT id, tweet_text, tweet_type, sent, tweet_time, tweet_date, created_at
+    FROM {_SAFE_TABLE} {{where}}
+    ORDER BY id DESC
+    LIMIT ? {{offset}}
+"""
+# Page by number (OFFSET) - used for the first page and when walking back
+_SQL_PAGE = {
+    name: _SQL_PAGE_BASE.format(where=f"WHERE {cond}" if cond else "", offset="OFFSET ?")
+    for name, cond in _TWEET_FILTERS.items()
+}
+# Keyset page: rows older than the last id already shown, so deep pages don't scan skipped rows
+_SQL_PAGE_BEFORE = {
+    name: _SQL_PAGE_BASE.format(where=f"WHERE id < ? AND {cond}" if cond else "WHERE id < ?", offset="")
+    for name, cond in _TWEET_FILTERS.items()
+}
+_SQL_FILTER_COUNT = {
+    name: f"SELECT COUNT(*) FROM {_SAFE_TABLE} WHERE {cond}" if cond else f"SELECT COUNT(*) FROM {_SAFE_TABLE}"
+    for name, cond in _TWEET_FILTERS.items()
+}
+
+# Per-filter row counts for pagination, kept briefly instead of counting on every page
+FILTER_COUNT_TTL = 5.0
+_filter_count_cache = {}  # filter_type -> (count, expires, tweets_generation)
+
+def invalidate_filter_counts():
+    """Drop cached tweet counts after tweets are changed or removed"""
+    _filter_count_cache.clear()
+
+def get_filtered_tweet_count(cursor, filter_type):
+    """Get the row count for a tweet history filter, cached for FILTER_COUNT_TTL seconds"""
+    now = time.monotonic()
+    cached = _filter_count_cache.get(filter_type)
+    if cached and now < cached[1] and cached[2] == database.tweets_generation:
+        return cached[0]
+    
+    generation = database.tweets_generation
+    cursor.execute(_SQL_FILTER_COUNT[filter_type])
+    count = cursor.fetchone()[0]
+    _filter_count_cache[filter_type] = (count, now + FILTER_COUNT_TTL, generation)
+    return count
 
-def get_tweets_from_db(page, per_page, filter_type='all'):
-    """Get paginated tweets from database with filtering"""
+def get_tweets_from_db(page, per_page, filter_type='all', before_id=None):
+    """Get paginated tweets from database with filtering (keyset paging when before_id is given)
+    
+    Returns (tweets, total_count, has_more); has_more is True when rows exist past this page.
+    """
     try:
-        conn = database.get_db_connection()
+        conn = get_request_db()
         if conn:
             cursor = conn.cursor()
             offset = (page - 1) * per_page
             
-            # Build WHERE clause based on filter
-            where_clause = ""
-            params = []
-            
-            if filter_type == 'success':
-                where_clause = "WHERE sent = 1"
-            elif filter_type == 'failed':
-                where_clause = "WHERE sent = 0"
-            elif filter_type == 'manual':
-                where_clause = "WHERE tweet_type = 'manual'"
-            elif filter_type == 'auto':
-                where_clause = "WHERE tweet_type = 'tweet'"
-            
-            # Get total count for pagination with validated table name
-            safe_table = get_safe_table_name()
-            if not safe_table:
-                return jsonify({"success": False, "message": "Güvenlik hatası: Geçersiz tablo adı"})
-                
-            # Single optimized query with window function (no separate COUNT query needed)
-            params.extend([per_page, offset])
-            query = f"""
-                SELECT 
-                    id, tweet_text, tweet_type, sent, tweet_time, tweet_date, created_at,
-                    COUNT(*) OVER() as total_count
-                FROM {safe_table} 
-                {where_clause}
-                ORDER BY created_at DESC 
-                LIMIT ? OFFSET ?
-            """
-            
-            cursor.execute(query, params)
-            tweets = cursor.fetchall()
-            
-            # Extract total_count from first row (window function result)
-            total_count = tweets[0][7] if tweets else 0  # 8th column (0-indexed) is total_count
+            # Unknown filters show everything
+            if filter_type not in _TWEET_FILTERS:
+                filter_type = 'all'
             
-            # Remove total_count from tweet data (keep only first 7 columns)
-            tweets = [tweet[:7] for tweet in tweets]
+            # Page query stops after LIMIT rows; the total comes from the count cache.
+            # One extra row is fetched to tell whether a next page exists, then trimmed
+            limit = per_page + 1
+            cursor.arraysize = limit  # One batched fetch for the whole page
+            if before_id is not None:
+                cursor.execute(_SQL_PAGE_BEFORE[filter_type], (before_id, limit))
+            else:
+                cursor.execute(_SQL_PAGE[filter_type], (limit, offset))
+            tweets = cursor.fetchmany()
+            has_more = len(tweets) > per_page
+            total_count = get_filtered_tweet_count(cursor, filter_type)
             
             cursor.close()
-            conn.close()
-            return tweets, total_count
+            return tweets[:per_page], total_count, has_more
     except Exception as e:
-        print(f"Database error: {e}")
-    return [], 0
+        log.error("Database error: %s", e)
+    return [], 0, False
+
+# Trend country code <-> trends URL mappings (read-only)
+_COUNTRY_URLS = MappingProxyType({
+    'turkey': 'https://xtrends.iamrohit.in/turkey',
+    'usa': 'https://xtrends.iamrohit.in/united-states',
+    'uk': 'https://xtrends.iamrohit.in/united-kingdom',
+    'germany': 'https://xtrends.iamrohit.in/germany',
+    'france': 'https://xtrends.iamrohit.in/france',
+    'italy': 'https://xtrends.iamrohit.in/italy',
+    'spain': 'https://xtrends.iamrohit.in/spain',
+    'netherlands': 'https://xtrends.iamrohit.in/netherlands',
+    'canada': 'https://xtrends.iamrohit.in/canada',
+    'australia': 'https://xtrends.iamrohit.in/australia',
+    'japan': 'https://xtrends.iamrohit.in/japan',
+    'korea': 'https://xtrends.iamrohit.in/south-korea',
+    'india': 'https://xtrends.iamrohit.in/india',
+    'brazil': 'https://xtrends.iamrohit.in/brazil',
+    'mexico': 'https://xtrends.iamrohit.in/mexico'
+})
+_URL_TO_COUNTRY = MappingProxyType({url: country for country, url in _COUNTRY_URLS.items()})
+
+# Config key -> token.env key, plus the reverse index used by write_token_env
+_CONFIG_MAPPINGS = MappingProxyType({
+    'sleep_hours': 'SLEEP_HOURS',
+    'trends_limit': 'TRENDS_LIMIT',
+    'cycle_duration': 'CYCLE_DURATION_MINUTES',
+    'night_mode_start': 'NIGHT_MODE_START',
+    'night_mode_end': 'NIGHT_MODE_END',
+    'trend_country': 'TRENDS_URL',
+    'ai_temperature': 'AI_TEMPERATURE',
+    'ai_model': 'GEMINI_MODEL',
+    # API Credentials
+    'api_key': 'api_key',
+    'api_secret': 'api_secret',
+    'access_token': 'access_token',
+    'access_token_secret': 'access_token_secret',
+    'bearer_token': 'bearer_token',
+    'user_id': 'USER_ID',
+    'gemini_api_key': 'gemini_api_key',
+    'flask_secret_key': 'FLASK_SECRET_KEY'
+})
+_ENV_TO_CONFIG = MappingProxyType({env_key: config_key for config_key, env_key in _CONFIG_MAPPINGS.items()})
+
+# Strips newline, carriage return and NUL from token.env values in one pass
+_SANITIZE_TABLE = str.maketrans('', '', '\n\r\0')
+
+# get_current_config() result, rebuilt only when token.env changes on disk
+TOKEN_ENV_PATH = 'token.env'
+_config_cache = {'mtime': 0, 'value': None}
 
 def get_current_config():
-    """Get current bot configuration - always use environment variables for latest values"""
-    # Always reload environment variables to get latest values
-    reload_config()  # Force reload from centralized config
-    
-    # URL to country code mapping (reverse of country_urls)
-    url_to_country = {
-        'https://xtrends.iamrohit.in/turkey': 'turkey',
-        'https://xtrends.iamrohit.in/united-states': 'usa',
-        'https://xtrends.iamrohit.in/united-kingdom': 'uk',
-        'https://xtrends.iamrohit.in/germany': 'germany',
-        'https://xtrends.iamrohit.in/france': 'france',
-        'https://xtrends.iamrohit.in/italy': 'italy',
-        'https://xtrends.iamrohit.in/spain': 'spain',
-        'https://xtrends.iamrohit.in/netherlands': 'netherlands',
-        'https://xtrends.iamrohit.in/canada': 'canada',
-        'https://xtrends.iamrohit.in/australia': 'australia',
-        'https://xtrends.iamrohit.in/japan': 'japan',
-        'https://xtrends.iamrohit.in/south-korea': 'korea',
-        'https://xtrends.iamrohit.in/india': 'india',
-        'https://xtrends.iamrohit.in/brazil': 'brazil',
-        'https://xtrends.iamrohit.in/mexico': 'mexico'
-    }
+    """Get current bot configuration - rebuilt from environment variables whenever token.env changes"""
+    try:
+        mtime = os.stat(TOKEN_ENV_PATH).st_mtime
+    except OSError:
+        mtime = None  # No file to watch - always rebuild
+    if mtime is not None and mtime == _config_cache['mtime'] and _config_cache['value'] is not None:
+        return dict(_config_cache['value'])
+    
+    # token.env changed - reload environment variables to get latest values
+    refresh_config()  # Force reload from centralized config
     
     current_url = get_config("TRENDS_URL", "https://xtrends.iamrohit.in/turkey")
-    trend_country = url_to_country.get(current_url, 'turkey')
+    trend_country = _URL_TO_COUNTRY.get(current_url, 'turkey')
     
-    # Parse SLEEP_HOURS safely
-    sleep_hours_raw = get_config("SLEEP_HOURS", "1,3,9,10")
-    # Remove brackets if present
-    if sleep_hours_raw.startswith('['):
-        sleep_hours_raw = sleep_hours_raw.strip('[]')
-    # Parse the hours
-    try:
-        sleep_hours = [int(x.strip()) for x in sleep_hours_raw.split(",")]
-    except ValueError:
-        sleep_hours = [1, 3, 9, 10]  # Default values
+    # SLEEP_HOURS is parsed once per reload in _RuntimeConfig
+    sleep_hours = list(_CFG.sleep_hours)
 
-    return {
+    current_config = {
         "trends_limit": get_int_config("TRENDS_LIMIT", 3),
         "sleep_hours": sleep_hours,
         "cycle_duration": get_int_config("CYCLE_DURATION_MINUTES", 60),
@@ -1172,18 +1500,22 @@ def get_current_config():
         "user_id": get_config("USER_ID", ""),
         "gemini_api_key": get_config("gemini_api_key", "")
     }
+    if mtime is not None:
+        _config_cache['value'] = current_config
+        _config_cache['mtime'] = mtime
+    return dict(current_config)
 
 def get_current_config_old():
     """Old implementation - kept for reference"""
-    print(f"DEBUG: API_MODULES_LOADED = {API_MODULES_LOADED}")  # Debug
+    log.debug("API_MODULES_LOADED = %s", API_MODULES_LOADED)
     if not API_MODULES_LOADED:
         # Reload environment variables to get latest values
-        reload_config()
+        refresh_config()
         
         # Return configuration from centralized config
         trends_limit_val = get_config("TRENDS_LIMIT", "3")
         trends_limit_int = int(trends_limit_val)
-        print(f"DEBUG: TRENDS_LIMIT from env = '{trends_limit_val}' -> int = {trends_limit_int}")  # Debug
+        log.debug("TRENDS_LIMIT from env = '%s' -> int = %d", trends_limit_val, trends_limit_int)
         return {
             "trends_limit": trends_limit_int,
             "sleep_hours": get_config("SLEEP_HOURS", "1,3,9,10").split(","),
@@ -1210,36 +1542,30 @@ def get_current_trends():
         return []
     try:
         # Use trend limit from configuration
-        trend_limit = get_int_config('TRENDS_LIMIT', 3)
+        trend_limit = _cfg_int('TRENDS_LIMIT', 3)
         trends = trend.prepareTrend(trend_limit)
         return trends if trends else []
     except Exception as e:
-        print(f"Trends fetch error: {e}")
+        log.error("Trends fetch error: %s", e)
         return []
 
 def run_bot_thread():
     """Run bot in separate thread with proper event-based termination"""
     global bot_running
     if not API_MODULES_LOADED or not main:
-        print("[ERROR] Bot modules not loaded - cannot start bot")
-        with bot_lock:
-            bot_running = False
+        log.error("Bot modules not loaded - cannot start bot")
+        bot_running = False
+        bot_done_event.set()
         return
 
     try:
-        # Import required modules
-        import time
-        import random
-        from config import get_int_config
-
         CYCLE_DURATION_MINUTES = get_int_config("CYCLE_DURATION_MINUTES", 30)
 
         # Initialize bot modules first
         if hasattr(main, 'initialize_bot_modules'):
             if not main.initialize_bot_modules():
-                print("[ERROR] Could not initialize bot modules")
-                with bot_lock:
-                    bot_running = False
+                log.error("Could not initialize bot modules")
+                bot_running = False
                 return
 
         while not bot_stop_event.is_set():
@@ -1249,16 +1575,16 @@ def run_bot_thread():
 
                 # Check if it's trending time
                 if main.isTrendingTime():
-                    print(f"[{datetime.now().strftime('%H:%M:%S')}] Getting Trending Topics...")
+                    log.info("Getting Trending Topics...")
                     broadcast_console_log('INFO', 'Getting trending topics...')
 
                     # Get trending topics
                     topic = main.trending_tweets()
                     if not topic:
-                        print("[!] No trending topics found")
+                        log.warning("No trending topics found")
                         broadcast_console_log('WARNING', 'No trending topics found')
                         # Wait before retry
-                        if bot_stop_event.wait(timeout=60):
+                        if bot_stop_event.wait(60):
                             break
                         continue
 
@@ -1267,12 +1593,12 @@ def run_bot_thread():
                     context = "Kullanıcı tarafından ek bağlam eklenmedi. Konu detaylarını kullanarak bağlamı ve amacı anlamalısın. Tweet referansı için detayları kullan."
                     prompt += context + " " + str(topic)
                 else:
-                    print(f"[{datetime.now().strftime('%H:%M:%S')}] Sleep hour - using general prompt")
+                    log.info("Sleep hour - using general prompt")
                     broadcast_console_log('INFO', 'Sleep hour - using general prompt')
                     prompt = "En ilgi çekici ve güncel konuda bir tweet oluştur."
 
                 # Generate AI tweet
-                print(f"[{datetime.now().strftime('%H:%M:%S')}] Generating Reply...Topic: {prompt[:100]}...")
+                log.info("Generating Reply...Topic: %s...", prompt[:100])
                 broadcast_console_log('INFO', f'Generating AI tweet for: {str(topic)[:100] if topic else "general topic"}')
 
                 if hasattr(main, 'reply') and main.reply:
@@ -1284,14 +1610,14 @@ def run_bot_thread():
 
                 # Check if tweet is None (political topic)
                 if tweet is None:
-                    print(f"[{datetime.now().strftime('%H:%M:%S')}] Political topic detected, skipping...")
+                    log.warning("Political topic detected, skipping...")
                     broadcast_console_log('WARNING', 'Political topic detected, skipping to avoid controversy')
                     # Try again with shorter wait
-                    if bot_stop_event.wait(timeout=10):
+                    if bot_stop_event.wait(10):
                         break
                     continue
                 elif tweet:
-                    print(f"[{datetime.now().strftime('%H:%M:%S')}] Tweet generated: {tweet}")
+                    log.info("Tweet generated: %s", tweet)
                     broadcast_console_log('SUCCESS', f'Tweet generated: {tweet}')
 
                     # Post tweet
@@ -1301,66 +1627,70 @@ def run_bot_thread():
                     database.save_tweets(tweet=tweet, tweet_type="tweet", status=status)
 
                     if status:
-                        print(f"[{datetime.now().strftime('%H:%M:%S')}] Tweet posted successfully!")
+                        log.info("Tweet posted successfully!")
                         broadcast_console_log('SUCCESS', 'Tweet posted successfully!')
                         bot_stats["last_tweet"] = tweet[:50] + "..." if len(tweet) > 50 else tweet
-                        bot_stats["last_tweet_time"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                        bot_stats["last_tweet_time"] = datetime.now().isoformat(sep=' ', timespec='seconds')
 
                         # Emit new tweet event
                         socketio.emit('new_tweet', {
                             'tweet': tweet,
-                            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                            'timestamp': datetime.now().isoformat(sep=' ', timespec='seconds')
                         })
                     else:
-                        print(f"[{datetime.now().strftime('%H:%M:%S')}] Failed to post tweet")
+                        log.error("Failed to post tweet")
                         broadcast_console_log('ERROR', 'Failed to post tweet')
                 else:
-                    print(f"[{datetime.now().strftime('%H:%M:%S')}] Failed to generate tweet")
+                    log.error("Failed to generate tweet")
                     broadcast_console_log('ERROR', 'Failed to generate tweet')
 
                 # Update stats
-                bot_stats["last_check"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                bot_stats["last_check"] = datetime.now().isoformat(sep=' ', timespec='seconds')
 
                 # Sleep with interruptible wait
-                print(f"[{datetime.now().strftime('%H:%M:%S')}] Sleeping for {CYCLE_DURATION_MINUTES} minutes...")
+                log.info("Sleeping for %d minutes...", CYCLE_DURATION_MINUTES)
                 broadcast_console_log('INFO', f'Next tweet in {CYCLE_DURATION_MINUTES} minutes')
 
-                if bot_stop_event.wait(timeout=CYCLE_DURATION_MINUTES * 60):
+                if bot_stop_event.wait(CYCLE_DURATION_MINUTES * 60):
                     break  # Event was set during wait, exit loop
 
             except Exception as cycle_error:
-                print(f"Bot cycle error: {cycle_error}")
+                log.error("Bot cycle error: %s", cycle_error)
                 broadcast_console_log('ERROR', f'Bot cycle error: {str(cycle_error)}')
                 # Continue running even if one cycle fails
-                if bot_stop_event.wait(timeout=60):  # Wait 1 minute before retry
+                if bot_stop_event.wait(60):  # Wait 1 minute before retry
                     break
 
     except Exception as e:
-        print(f"Bot thread error: {e}")
+        log.error("Bot thread error: %s", e)
         broadcast_console_log('ERROR', f'Bot thread error: {str(e)}')
     finally:
-        with bot_lock:
-            bot_running = False
-        print("[INFO] Bot thread terminated gracefully")
+        bot_running = False
+        bot_done_event.set()
+        log.info("Bot thread terminated gracefully")
         broadcast_console_log('INFO', 'Bot stopped')
 
 # SocketIO Events
+# Rooms clients may join on connect: monitoring page, config (admin) page, everything else
+SOCKET_ROOMS = frozenset(('monitor', 'admin', 'dashboard'))
+
 @socketio.on('connect')
 def handle_connect():
     """Handle client connection"""
-    from flask import request
     client_id = request.sid
     connected_clients.add(client_id)
-    print(f'[+] Client {client_id} connected to real-time updates (Total: {len(connected_clients)})')
+    # Page-scoped room so page-specific events only reach interested clients
+    page = request.args.get('page', 'dashboard')
+    join_room(page if page in SOCKET_ROOMS else 'dashboard')
+    log.debug('Client %s connected to real-time updates (Total: %d)', client_id, len(connected_clients))
     emit('status', {'message': 'Gerçek zamanlı güncellemeler aktif'})
 
 @socketio.on('disconnect')
 def handle_disconnect():
     """Handle client disconnection"""
-    from flask import request
     client_id = request.sid
     connected_clients.discard(client_id)  # Remove client safely
-    print(f'[-] Client {client_id} disconnected from real-time updates (Remaining: {len(connected_clients)})')
+    log.debug('Client %s disconnected from real-time updates (Remaining: %d)', client_id, len(connected_clients))
 
 @socketio.on('request_status')
 def handle_status_request():
@@ -1368,33 +1698,189 @@ def handle_status_request():
     update_stats()
     emit('bot_status', {
         'running': bot_running,
-        'stats': bot_stats
+        'stats': get_bot_stats()
     })
 
 # Real-time update functions
+def _broadcast(event, payload, room=None):
+    """Emit to all clients (or one room) - packet encoded once - then yield to other green threads"""
+    socketio.emit(event, payload, to=room)
+    socketio.sleep(0)
+
 def broadcast_bot_status():
     """Broadcast bot status to all connected clients"""
-    socketio.emit('bot_status', {
+    _broadcast('bot_status', {
         'running': bot_running,
-        'stats': bot_stats
+        'stats': get_bot_stats()
     })
 
 def broadcast_new_tweet(tweet_text, status):
     """Broadcast new tweet to all connected clients"""
-    socketio.emit('new_tweet', {
+    # Fan-out runs as a background task so the HTTP response isn't held up
+    socketio.start_background_task(_emit_new_tweet, tweet_text, status)
+
+def _emit_new_tweet(tweet_text, status):
+    """Build and emit the new_tweet payload (runs in a background task)"""
+    _broadcast('new_tweet', {
         'tweet': tweet_text,
         'status': status,
-        'timestamp': datetime.now().strftime("%H:%M:%S")
+        'timestamp': time.strftime("%H:%M:%S")
     })
 
+# Console log lines are buffered and sent as one console_log_batch every LOG_FLUSH_INTERVAL
+LOG_FLUSH_INTERVAL = 0.25
+_log_buf = collections.deque(maxlen=500)
+_log_lock = threading.Lock()
+_log_flusher_started = False
+
 def broadcast_console_log(log_type, message):
     """Broadcast console log to monitoring page"""
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    socketio.emit('console_log', {
-        'type': log_type,
-        'message': message,
-        'timestamp': timestamp
-    })
+    global _log_flusher_started
+    with _log_lock:
+        # Timestamp is stamped once per batch in _flush_console_logs
+        _log_buf.append({
+            'type': log_type,
+            'message': message
+        })
+        if not _log_flusher_started:
+            socketio.start_background_task(_flush_console_logs)
+            _log_flusher_started = True
+
+def _flush_console_logs():
+    """Emit buffered console log lines as a single batch"""
+    while True:
+        socketio.sleep(LOG_FLUSH_INTERVAL)
+        with _log_lock:
+            if not _log_buf:
+                continue
+            batch = list(_log_buf)
+            _log_buf.clear()
+        timestamp = time.strftime("%H:%M:%S")
+        for entry in batch:
+            entry['timestamp'] = timestamp
+        _broadcast('console_log_batch', batch, room='monitor')
+
+# Validation rules for each configuration key (patterns compiled once at import)
+_VALIDATION_RULES = {
+    'trends_limit': {
+        'type': int,
+        'min': 1,
+        'max': 50,
+        'description': 'Number of trends to fetch'
+    },
+    'cycle_duration': {
+        'type': int, 
+        'min': 1,
+        'max': 1440,  # Max 24 hours
+        'description': 'Cycle duration in minutes'
+    },
+    'night_mode_start': {
+        'type': int,
+        'min': 0,
+        'max': 23,
+        'description': 'Night mode start hour'
+    },
+    'night_mode_end': {
+        'type': int,
+        'min': 0, 
+        'max': 23,
+        'description': 'Night mode end hour'
+    },
+    'ai_temperature': {
+        'type': float,
+        'min': 0.0,
+        'max': 2.0,
+        'description': 'AI creativity level'
+    },
+    'sleep_hours': {
+        'type': list,
+        'element_type': int,
+        'min_elements': 0,
+        'max_elements': 24,
+        'element_min': 0,
+        'element_max': 23,
+        'description': 'Hours when bot sleeps'
+    },
+    'trend_country': {
+        'type': str,
+        'allowed_values': [
+            'turkey', 'usa', 'uk', 'germany', 'france', 'italy', 
+            'spain', 'netherlands', 'canada', 'australia', 'japan',
+            'korea', 'india', 'brazil', 'mexico'
+        ],
+        'description': 'Country for trending topics'
+    },
+    'ai_model': {
+        'type': str,
+        'allowed_values': [
+            'gemini-1.5-pro', 'gemini-1.5-flash', 'gemini-1.0-pro',
+            'gemini-2.0-flash-exp', 'gemini-2.5-flash'
+        ],
+        'description': 'AI model to use'
+    },
+    'api_key': {
+        'type': str,
+        'min_length': 10,
+        'max_length': 200,
+        'pattern': re.compile(r'^[A-Za-z0-9_-]+\Z', re.ASCII),
+        'description': 'Twitter API key'
+    },
+    'api_secret': {
+        'type': str,
+        'min_length': 10,
+        'max_length': 200,
+        'pattern': re.compile(r'^[A-Za-z0-9_-]+\Z', re.ASCII),
+        'description': 'Twitter API secret'
+    },
+    'access_token': {
+        'type': str,
+        'min_length': 10,
+        'max_length': 200,
+        'pattern': re.compile(r'^[A-Za-z0-9_-]+\Z', re.ASCII),
+        'description': 'Twitter access token'
+    },
+    'access_token_secret': {
+        'type': str,
+        'min_length': 10,
+        'max_length': 200,
+        'pattern': re.compile(r'^[A-Za-z0-9_-]+\Z', re.ASCII),
+        'description': 'Twitter access token secret'
+    },
+    'bearer_token': {
+        'type': str,
+        'min_length': 10,
+        'max_length': 500,
+        'pattern': re.compile(r'^[A-Za-z0-9_%-]+\Z', re.ASCII),
+        'description': 'Twitter bearer token'
+    },
+    'user_id': {
+        'type': str,
+        'min_length': 1,
+        'max_length': 50,
+        'pattern': re.compile(r'^[0-9]+\Z', re.ASCII),
+        'description': 'Twitter user ID (numeric)'
+    },
+    'gemini_api_key': {
+        'type': str,
+        'min_length': 10,
+        'max_length': 200,
+        'pattern': re.compile(r'^[A-Za-z0-9_-]+\Z', re.ASCII),
+        'description': 'Gemini API key'
+    },
+    'flask_secret_key': {
+        'type': str,
+        'min_length': 32,
+        'max_length': 500,
+        'description': 'Flask secret key for session security'
+    }
+}
+
+# Hash-based allowed_values membership; the ordered list is kept for error messages
+for _rule in _VALIDATION_RULES.values():
+    if 'allowed_values' in _rule:
+        _rule['allowed_values_list'] = tuple(_rule['allowed_values'])
+        _rule['allowed_values'] = frozenset(_rule['allowed_values'])
+del _rule
 
 def validate_config_value(key, value):
     """
@@ -1402,127 +1888,11 @@ def validate_config_value(key, value):
     Returns: (is_valid: bool, sanitized_value: str, error_message: str)
     """
     
-    # Define validation rules for each configuration key
-    validation_rules = {
-        'trends_limit': {
-            'type': int,
-            'min': 1,
-            'max': 50,
-            'description': 'Number of trends to fetch'
-        },
-        'cycle_duration': {
-            'type': int, 
-            'min': 1,
-            'max': 1440,  # Max 24 hours
-            'description': 'Cycle duration in minutes'
-        },
-        'night_mode_start': {
-            'type': int,
-            'min': 0,
-            'max': 23,
-            'description': 'Night mode start hour'
-        },
-        'night_mode_end': {
-            'type': int,
-            'min': 0, 
-            'max': 23,
-            'description': 'Night mode end hour'
-        },
-        'ai_temperature': {
-            'type': float,
-            'min': 0.0,
-            'max': 2.0,
-            'description': 'AI creativity level'
-        },
-        'sleep_hours': {
-            'type': list,
-            'element_type': int,
-            'min_elements': 0,
-            'max_elements': 24,
-            'element_min': 0,
-            'element_max': 23,
-            'description': 'Hours when bot sleeps'
-        },
-        'trend_country': {
-            'type': str,
-            'allowed_values': [
-                'turkey', 'usa', 'uk', 'germany', 'france', 'italy', 
-                'spain', 'netherlands', 'canada', 'australia', 'japan',
-                'korea', 'india', 'brazil', 'mexico'
-            ],
-            'description': 'Country for trending topics'
-        },
-        'ai_model': {
-            'type': str,
-            'allowed_values': [
-                'gemini-1.5-pro', 'gemini-1.5-flash', 'gemini-1.0-pro',
-                'gemini-2.0-flash-exp', 'gemini-2.5-flash'
-            ],
-            'description': 'AI model to use'
-        },
-        'api_key': {
-            'type': str,
-            'min_length': 10,
-            'max_length': 200,
-            'pattern': r'^[A-Za-z0-9_-]+$',
-            'description': 'Twitter API key'
-        },
-        'api_secret': {
-            'type': str,
-            'min_length': 10,
-            'max_length': 200,
-            'pattern': r'^[A-Za-z0-9_-]+$',
-            'description': 'Twitter API secret'
-        },
-        'access_token': {
-            'type': str,
-            'min_length': 10,
-            'max_length': 200,
-            'pattern': r'^[A-Za-z0-9_-]+$',
-            'description': 'Twitter access token'
-        },
-        'access_token_secret': {
-            'type': str,
-            'min_length': 10,
-            'max_length': 200,
-            'pattern': r'^[A-Za-z0-9_-]+$',
-            'description': 'Twitter access token secret'
-        },
-        'bearer_token': {
-            'type': str,
-            'min_length': 10,
-            'max_length': 500,
-            'pattern': r'^[A-Za-z0-9_%-]+$',
-            'description': 'Twitter bearer token'
-        },
-        'user_id': {
-            'type': str,
-            'min_length': 1,
-            'max_length': 50,
-            'pattern': r'^[0-9]+$',
-            'description': 'Twitter user ID (numeric)'
-        },
-        'gemini_api_key': {
-            'type': str,
-            'min_length': 10,
-            'max_length': 200,
-            'pattern': r'^[A-Za-z0-9_-]+$',
-            'description': 'Gemini API key'
-        },
-        'flask_secret_key': {
-            'type': str,
-            'min_length': 32,
-            'max_length': 500,
-            'description': 'Flask secret key for session security'
-        }
-    }
-    
     # Check if key is allowed
-    if key not in validation_rules:
+    rule = _VALIDATION_RULES.get(key)
+    if rule is None:
         return False, "", f"Configuration key '{key}' is not allowed"
     
-    rule = validation_rules[key]
-    
     try:
         # Type validation and conversion
         if rule['type'] == int:
@@ -1558,13 +1928,12 @@ def validate_config_value(key, value):
             
             # Pattern validation
             if 'pattern' in rule:
-                import re
-                if not re.match(rule['pattern'], sanitized):
+                if not rule['pattern'].match(sanitized):
                     return False, "", f"{rule['description']} contains invalid characters"
                     
             # Allowed values validation
             if 'allowed_values' in rule and sanitized not in rule['allowed_values']:
-                return False, "", f"{rule['description']} must be one of: {', '.join(rule['allowed_values'])}"
+                return False, "", f"{rule['description']} must be one of: {', '.join(rule['allowed_values_list'])}"
                 
         elif rule['type'] == list:
             if isinstance(value, str):
@@ -1616,176 +1985,184 @@ def validate_config_value(key, value):
     except (ValueError, TypeError) as e:
         return False, "", f"Invalid {rule['description']}: {str(e)}"
 
+def _changed_config_keys(before, after):
+    """Keys whose value differs between two get_current_config() snapshots"""
+    return sorted(key for key in before.keys() | after.keys() if before.get(key) != after.get(key))
+
+def apply_config_update(validated_config):
+    """Write validated values to token.env, reload, and notify config pages; returns changed keys"""
+    old_config = get_current_config()
+    write_token_env(validated_config)  # Also reloads config
+    _config_cache['value'] = None  # Don't trust an mtime that may not have ticked
+    new_config = get_current_config()
+    
+    # SECURITY: Broadcast only the names of changed keys - never values (secrets);
+    # clients fetch the new config via GET /api/config.
+    # Both snapshots are typed the same way, so resubmitted values don't count as changes
+    changed_keys = _changed_config_keys(old_config, new_config)
+    socketio.emit('config_updated', {
+        'message': 'Konfigürasyon güncellendi ve otomatik olarak uygulandı!',
+        'changed_keys': changed_keys,
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'auto_applied': True
+    }, to='admin')
+    return changed_keys
+
+def validate_config_update(new_config):
+    """Validate every submitted config value; raises ValueError if any is rejected"""
+    # SECURITY: Validate all input values before processing
+    validated_config = {}
+    validation_errors = []
+    
+    for key, value in new_config.items():
+        is_valid, sanitized_value, error_msg = validate_config_value(key, value)
+        if not is_valid:
+            validation_errors.append(f"{key}: {error_msg}")
+            secure_log('warning', f"Validation failed for {key}", error_msg)
+        else:
+            validated_config[key] = sanitized_value
+            secure_log('debug', f"Validated {key}", sanitized_value)
+    
+    # If there are validation errors, reject the entire update
+    if validation_errors:
+        error_summary = "; ".join(validation_errors)
+        raise ValueError(f"Configuration validation failed: {error_summary}")
+    
+    secure_log('info', f"All {len(validated_config)} configuration values validated successfully")
+    return validated_config
+
 def update_token_env(new_config):
     """Update token.env file with validated configuration values"""
+    write_token_env(validate_config_update(new_config))
+
+def _format_env_line(env_key, config_key, value):
+    """Format one validated config value as a sanitized token.env line"""
+    if config_key == 'sleep_hours':
+        if not isinstance(value, str):
+            # Format as [1, 2, 3] with brackets and spaces to match token.env format
+            value = '[' + ', '.join(map(str, value)) + ']'
+    elif config_key == 'trend_country':
+        # Convert country code to URL (already validated)
+        value = _COUNTRY_URLS.get(value, _COUNTRY_URLS['turkey'])
+    else:
+        value = str(value)
+    # SECURITY: Additional sanitization for environment variables
+    # Remove any potentially dangerous characters
+    return f"{env_key}={value.translate(_SANITIZE_TABLE)}\n"
+
+def write_token_env(validated_config):
+    """Write already-validated configuration values to token.env"""
     try:
-        # SECURITY: Validate all input values before processing
-        validated_config = {}
-        validation_errors = []
-        
-        for key, value in new_config.items():
-            is_valid, sanitized_value, error_msg = validate_config_value(key, value)
-            if not is_valid:
-                validation_errors.append(f"{key}: {error_msg}")
-                secure_log('warning', f"Validation failed for {key}", error_msg)
-            else:
-                validated_config[key] = sanitized_value
-                secure_log('debug', f"Validated {key}", sanitized_value)
-        
-        # If there are validation errors, reject the entire update
-        if validation_errors:
-            error_summary = "; ".join(validation_errors)
-            raise ValueError(f"Configuration validation failed: {error_summary}")
-        
-        secure_log('info', f"All {len(validated_config)} configuration values validated successfully")
         # Read current token.env file
         with open('token.env', 'r', encoding='utf-8') as f:
             lines = f.readlines()
         
-        # Configuration mappings
-        config_mappings = {
-            'sleep_hours': 'SLEEP_HOURS',
-            'trends_limit': 'TRENDS_LIMIT',
-            'cycle_duration': 'CYCLE_DURATION_MINUTES',
-            'night_mode_start': 'NIGHT_MODE_START',
-            'night_mode_end': 'NIGHT_MODE_END',
-            'trend_country': 'TRENDS_URL',
-            'ai_temperature': 'AI_TEMPERATURE',
-            'ai_model': 'GEMINI_MODEL',
-            # API Credentials
-            'api_key': 'api_key',
-            'api_secret': 'api_secret',
-            'access_token': 'access_token',
-            'access_token_secret': 'access_token_secret',
-            'bearer_token': 'bearer_token',
-            'user_id': 'USER_ID',
-            'gemini_api_key': 'gemini_api_key',
-            'flask_secret_key': 'FLASK_SECRET_KEY'
-        }
-        
-        # Country to URL mappings
-        country_urls = {
-            'turkey': 'https://xtrends.iamrohit.in/turkey',
-            'usa': 'https://xtrends.iamrohit.in/united-states',
-            'uk': 'https://xtrends.iamrohit.in/united-kingdom',
-            'germany': 'https://xtrends.iamrohit.in/germany',
-            'france': 'https://xtrends.iamrohit.in/france',
-            'italy': 'https://xtrends.iamrohit.in/italy',
-            'spain': 'https://xtrends.iamrohit.in/spain',
-            'netherlands': 'https://xtrends.iamrohit.in/netherlands',
-            'canada': 'https://xtrends.iamrohit.in/canada',
-            'australia': 'https://xtrends.iamrohit.in/australia',
-            'japan': 'https://xtrends.iamrohit.in/japan',
-            'korea': 'https://xtrends.iamrohit.in/south-korea',
-            'india': 'https://xtrends.iamrohit.in/india',
-            'brazil': 'https://xtrends.iamrohit.in/brazil',
-            'mexico': 'https://xtrends.iamrohit.in/mexico'
-        }
-
-        # Update lines with validated values only
-        updated_lines = []
-        for line in lines:
-            line_updated = False
-            for config_key, env_key in config_mappings.items():
-                if line.startswith(f"{env_key}=") and config_key in validated_config:
-                    if config_key == 'sleep_hours':
-                        # Handle sleep_hours as comma-separated list
-                        if isinstance(validated_config[config_key], str):
-                            # Already validated as string
-                            value = validated_config[config_key]
-                        else:
-                            # Convert list to comma-separated string
-                            value = ','.join(map(str, validated_config[config_key]))
-                    elif config_key == 'trend_country':
-                        # Convert country code to URL (already validated)
-                        country = validated_config[config_key]
-                        value = country_urls.get(country, country_urls['turkey'])
-                    else:
-                        value = str(validated_config[config_key])
-                    
-                    # SECURITY: Additional sanitization for environment variables
-                    # Remove any potentially dangerous characters
-                    sanitized_value = value.replace('\n', '').replace('\r', '').replace('\0', '')
-                    updated_lines.append(f"{env_key}={sanitized_value}\n")
-                    line_updated = True
-                    break
-            
-            if not line_updated:
-                updated_lines.append(line)
-        
-        # Handle sleep_hours separately (already validated)
-        if 'sleep_hours' in validated_config:
-            sleep_hours_updated = False
-            for i, line in enumerate(updated_lines):
-                if line.startswith('SLEEP_HOURS='):
-                    if isinstance(validated_config['sleep_hours'], str):
-                        value = validated_config['sleep_hours']
-                    else:
-                        # Format as [1, 2, 3] with brackets and spaces to match token.env format
-                        value = '[' + ', '.join(map(str, validated_config['sleep_hours'])) + ']'
-                    # SECURITY: Sanitize value
-                    sanitized_value = value.replace('\n', '').replace('\r', '').replace('\0', '')
-                    updated_lines[i] = f"SLEEP_HOURS={sanitized_value}\n"
-                    sleep_hours_updated = True
-                    break
+        # Update lines with validated values only (single pass, one dict lookup per line)
+        updated_lines = [None] * len(lines)
+        for i, line in enumerate(lines):
+            env_key, sep, _ = line.partition('=')
+            config_key = _ENV_TO_CONFIG.get(env_key) if sep else None
+            if config_key is None or config_key not in validated_config:
+                updated_lines[i] = line
+                continue
+            updated_lines[i] = _format_env_line(env_key, config_key, validated_config[config_key])
         
         # SECURITY: Create backup before modifying file
         backup_filename = 'token.env.backup'
         try:
-            with open('token.env', 'r', encoding='utf-8') as original:
-                with open(backup_filename, 'w', encoding='utf-8') as backup:
-                    backup.write(original.read())
+            shutil.copyfile('token.env', backup_filename)
         except Exception as backup_error:
             print(f"[WARNING] Could not create backup: {backup_error}")
         
-        # Write validated configuration back to file
-        with open('token.env', 'w', encoding='utf-8') as f:
-            f.writelines(updated_lines)
+        # Write validated configuration to a temp file and swap it in atomically,
+        # so a crash mid-write never leaves a truncated token.env behind
+        new_text = ''.join(updated_lines)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath('token.env')), prefix='token.', suffix='.env.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(new_text)
+            shutil.copymode('token.env', tmp_path)  # Keep the original permissions
+            os.replace(tmp_path, 'token.env')
+        except OSError:
+            # e.g. token.env is a single-file bind mount that cannot be replaced
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            with open('token.env', 'w', encoding='utf-8') as f:
+                f.write(new_text)
         
         # Log security event (sanitized)
         secure_log('info', f"Configuration updated in token.env with {len(validated_config)} validated values")
         secure_log('info', "Updated keys", list(validated_config.keys()))
         
         # Force reload of centralized configuration
-        reload_config()
+        refresh_config()
+        _config_cache['mtime'] = 0  # Rebuild get_current_config() on next call
         
     except Exception as e:
         secure_log('error', "Error updating token.env", str(e))
         raise
 
-# Analytics API endpoints
+# Analytics API endpoints - window bound is a parameter so the SQL text never changes
+def _utc_cutoff(days):
+    """UTC cutoff in SQLite's CURRENT_TIMESTAMP format, for created_at >= ? comparisons"""
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(time.time() - days * 86400))
+
+_SQL_SUCCESS_RATE = """
+    SELECT
+        DATE(created_at) as date,
+        COUNT(*) as total_tweets,
+        SUM(CASE WHEN sent = 1 THEN 1 ELSE 0 END) as successful_tweets,
+        ROUND(
+            (SUM(CASE WHEN sent = 1 THEN 1 ELSE 0 END) * 100.0 / COUNT(*)), 2
+        ) as success_rate
+    FROM tweets
+    WHERE created_at >= ?
+    GROUP BY DATE(created_at)
+    ORDER BY date ASC
+"""
+
+_SQL_PERSONA_USAGE = """
+    SELECT
+        tweet_type,
+        COUNT(*) as count,
+        ROUND((COUNT(*) * 100.0 / (SELECT COUNT(*) FROM tweets)), 2) as percentage
+    FROM tweets
+    WHERE created_at >= ?
+    GROUP BY tweet_type
+    ORDER BY count DESC
+"""
+
+_SQL_HOURLY_ACTIVITY = """
+    SELECT
+        CAST(strftime('%H', created_at) AS INTEGER) as hour,
+        COUNT(*) as tweet_count
+    FROM tweets
+    WHERE created_at >= ?
+    GROUP BY hour
+    ORDER BY hour
+"""
+
 @app.route('/api/analytics/success_rate')
 def api_analytics_success_rate():
     """Get tweet success rate data for charts"""
     try:
-        analytics_memory_cleanup()  # Periodic memory cleanup
-        conn = sqlite3.connect(database.dbName)
+        conn = get_request_db()
         cursor = conn.cursor()
         
         # Get success rate data by day for last 30 days
-        cursor.execute("""
-            SELECT 
-                DATE(created_at) as date,
-                COUNT(*) as total_tweets,
-                SUM(CASE WHEN sent = 1 THEN 1 ELSE 0 END) as successful_tweets,
-                ROUND(
-                    (SUM(CASE WHEN sent = 1 THEN 1 ELSE 0 END) * 100.0 / COUNT(*)), 2
-                ) as success_rate
-            FROM tweets 
-            WHERE created_at >= datetime('now', '-30 days')
-            GROUP BY DATE(created_at) 
-            ORDER BY date DESC
-        """)
+        cursor.execute(_SQL_SUCCESS_RATE, (_utc_cutoff(30),))
         
         results = cursor.fetchall()
-        conn.close()
+        
+        # Unpack columns in one pass (rows already in chart order)
+        dates, _totals, _successes, rates = zip(*results) if results else ((), (), (), ())
         
         # Format data for Chart.js
         data = {
-            'labels': [row[0] for row in reversed(results)],
+            'labels': list(dates),
             'datasets': [{
                 'label': 'Başarı Oranı (%)',
-                'data': [row[3] for row in reversed(results)],
+                'data': list(rates),
                 'backgroundColor': 'rgba(29, 161, 242, 0.2)',
                 'borderColor': 'rgba(29, 161, 242, 1)',
                 'borderWidth': 2,
@@ -1793,76 +2170,68 @@ def api_analytics_success_rate():
             }]
         }
         
-        return jsonify({
+        return _json({
             'success': True,
             'data': data,
             'total_days': len(results)
         })
         
     except Exception as e:
-        return jsonify({
+        return _json({
             'success': False,
             'message': f'Analytics error: {str(e)}'
-        }), 500
+        }, 500)
+
+# Chart constants shared by the persona and hourly analytics endpoints
+_PERSONA_NAMES = MappingProxyType({
+    'tech': 'Teknik',
+    'casual': 'Gündelik',
+    'sad': 'Üzgün',
+    'default': 'Varsayılan'
+})
+_PERSONA_BG = (
+    'rgba(29, 161, 242, 0.8)',
+    'rgba(255, 193, 7, 0.8)',
+    'rgba(220, 53, 69, 0.8)',
+    'rgba(108, 117, 125, 0.8)'
+)
+_PERSONA_BORDER = (
+    'rgba(29, 161, 242, 1)',
+    'rgba(255, 193, 7, 1)',
+    'rgba(220, 53, 69, 1)',
+    'rgba(108, 117, 125, 1)'
+)
+_HOURLY_LABELS = tuple(f"{i:02d}:00" for i in range(24))
 
 @app.route('/api/analytics/personas')
 def api_analytics_personas():
     """Get persona usage statistics"""
     try:
-        analytics_memory_cleanup()  # Periodic memory cleanup
-        conn = sqlite3.connect(database.dbName)
+        conn = get_request_db()
         cursor = conn.cursor()
         
         # Get persona usage counts
-        cursor.execute("""
-            SELECT 
-                tweet_type,
-                COUNT(*) as count,
-                ROUND((COUNT(*) * 100.0 / (SELECT COUNT(*) FROM tweets)), 2) as percentage
-            FROM tweets 
-            WHERE created_at >= datetime('now', '-30 days')
-            GROUP BY tweet_type 
-            ORDER BY count DESC
-        """)
+        cursor.execute(_SQL_PERSONA_USAGE, (_utc_cutoff(30),))
         
         results = cursor.fetchall()
-        conn.close()
-        
-        # Persona display names
-        persona_names = {
-            'tech': 'Teknik',
-            'casual': 'Gündelik',
-            'sad': 'Üzgün',
-            'default': 'Varsayılan'
-        }
         
         # Format data for Chart.js pie chart
         data = {
-            'labels': [persona_names.get(row[0], row[0]) for row in results],
+            'labels': [_PERSONA_NAMES.get(row[0], row[0]) for row in results],
             'datasets': [{
                 'data': [row[1] for row in results],
-                'backgroundColor': [
-                    'rgba(29, 161, 242, 0.8)',
-                    'rgba(255, 193, 7, 0.8)',
-                    'rgba(220, 53, 69, 0.8)',
-                    'rgba(108, 117, 125, 0.8)'
-                ],
-                'borderColor': [
-                    'rgba(29, 161, 242, 1)',
-                    'rgba(255, 193, 7, 1)',
-                    'rgba(220, 53, 69, 1)',
-                    'rgba(108, 117, 125, 1)'
-                ],
+                'backgroundColor': _PERSONA_BG[:len(results)],
+                'borderColor': _PERSONA_BORDER[:len(results)],
                 'borderWidth': 1
             }]
         }
         
-        return jsonify({
+        return _json({
             'success': True,
             'data': data,
             'statistics': [
                 {
-                    'persona': persona_names.get(row[0], row[0]),
+                    'persona': _PERSONA_NAMES.get(row[0], row[0]),
                     'count': row[1],
                     'percentage': row[2]
                 } for row in results
@@ -1870,46 +2239,40 @@ def api_analytics_personas():
         })
         
     except Exception as e:
-        return jsonify({
+        return _json({
             'success': False,
             'message': f'Analytics error: {str(e)}'
-        }), 500
+        }, 500)
 
 @app.route('/api/analytics/hourly_activity')
 def api_analytics_hourly_activity():
     """Get hourly posting activity data"""
     try:
-        analytics_memory_cleanup()  # Periodic memory cleanup
-        conn = sqlite3.connect(database.dbName)
+        conn = get_request_db()
         cursor = conn.cursor()
         
         # Get tweet counts by hour for last 7 days
-        cursor.execute("""
-            SELECT 
-                CAST(strftime('%H', created_at) AS INTEGER) as hour,
-                COUNT(*) as tweet_count
-            FROM tweets 
-            WHERE created_at >= datetime('now', '-7 days')
-            GROUP BY hour 
-            ORDER BY hour
-        """)
+        cursor.execute(_SQL_HOURLY_ACTIVITY, (_utc_cutoff(7),))
         
         results = cursor.fetchall()
-        conn.close()
         
         # Create 24-hour data array (0-23)
         hourly_data = [0] * 24
         for hour, count in results:
             hourly_data[hour] = count
         
+        # Peak hour and count in a single pass (0 when there is no activity)
+        peak_hour = max(range(24), key=hourly_data.__getitem__)
+        peak = hourly_data[peak_hour] or 1
+        
         # Format data for Chart.js heatmap/bar chart
         data = {
-            'labels': [f"{i:02d}:00" for i in range(24)],
+            'labels': _HOURLY_LABELS,
             'datasets': [{
                 'label': 'Tweet Sayısı',
                 'data': hourly_data,
                 'backgroundColor': [
-                    f'rgba(29, 161, 242, {min(0.1 + (count / max(hourly_data or [1])) * 0.9, 1)})' 
+                    f'rgba(29, 161, 242, {min(0.1 + (count / peak) * 0.9, 1)})' 
                     for count in hourly_data
                 ],
                 'borderColor': 'rgba(29, 161, 242, 1)',
@@ -1917,67 +2280,95 @@ def api_analytics_hourly_activity():
             }]
         }
         
-        return jsonify({
+        return _json({
             'success': True,
             'data': data,
-            'peak_hour': hourly_data.index(max(hourly_data)) if hourly_data else 0,
+            'peak_hour': peak_hour,
             'total_tweets': sum(hourly_data)
         })
         
     except Exception as e:
-        return jsonify({
+        return _json({
             'success': False,
             'message': f'Analytics error: {str(e)}'
-        }), 500
+        }, 500)
+
+# Trending topic word extraction helpers
+_WORD_STRIP = re.compile(r'[^\w\sğüşıöçĞÜŞİÖÇ]')
+_STOPWORDS = frozenset({
+    'http', 'https', 'için', 'gibi', 'daha', 'kadar', 'olan', 'olarak', 'şimdi',
+    'değil', 'sonra', 'önce', 'bile', 'çünkü', 'hala', 'artık', 'bunu', 'şunu',
+    'this', 'that', 'with', 'from', 'have', 'what', 'your', 'they', 'will',
+})
+
+# Splits the last 30 days of sent tweets on spaces and counts raw words in SQLite
+# Every character str.split() treats as whitespace, other than ' ' itself
+_SPLIT_WHITESPACE = (
+    0x09, 0x0A, 0x0B, 0x0C, 0x0D, 0x1C, 0x1D, 0x1E, 0x1F, 0x85, 0xA0, 0x1680,
+    0x2000, 0x2001, 0x2002, 0x2003, 0x2004, 0x2005, 0x2006, 0x2007, 0x2008, 0x2009, 0x200A,
+    0x2028, 0x2029, 0x202F, 0x205F, 0x3000,
+)
+
+# Nested replace() calls per CTE step - SQLite's parser stack overflows at ~28 levels
+_WHITESPACE_REPLACES_PER_STEP = 8
+
+def _sql_whitespace_ctes(source):
+    """CTE steps that turn each _SPLIT_WHITESPACE character of source's t column into ' '
+    
+    Returns (cte_sql, last_cte_name); the replaces are spread over several CTEs
+    because nesting all of them in one expression overflows the SQL parser.
+    """
+    ctes = []
+    previous = source
+    for step, start in enumerate(range(0, len(_SPLIT_WHITESPACE), _WHITESPACE_REPLACES_PER_STEP)):
+        expr = 't'
+        for codepoint in _SPLIT_WHITESPACE[start:start + _WHITESPACE_REPLACES_PER_STEP]:
+            expr = f"replace({expr}, char({codepoint}), ' ')"
+        name = f"ws{step}"
+        ctes.append(f"{name}(t) AS (SELECT {expr} FROM {previous})")
+        previous = name
+    return ",\n    ".join(ctes), previous
+
+_TOPIC_WS_CTES, _TOPIC_WS_LAST = _sql_whitespace_ctes('recent')
+
+# Words are split on ' ' after normalizing whitespace, so the result matches str.split()
+_SQL_TOPIC_WORDS = f"""
+    WITH RECURSIVE recent(t) AS (
+        SELECT tweet_text FROM {_SAFE_TABLE}
+        WHERE created_at >= ? AND sent = 1
+    ),
+    {_TOPIC_WS_CTES},
+    split(word, rest) AS (
+        SELECT '', lower(t) || ' ' FROM {_TOPIC_WS_LAST}
+        UNION ALL
+        SELECT substr(rest, 1, instr(rest, ' ') - 1), substr(rest, instr(rest, ' ') + 1)
+        FROM split
+        WHERE rest != ''
+    )
+    SELECT word, COUNT(*) FROM split
+    WHERE length(word) > 3 AND word NOT LIKE 'http%'
+    GROUP BY word
+"""
 
 @app.route('/api/analytics/trending_topics')
 def api_analytics_trending_topics():
     """Get popular trending topics data with memory leak protection"""
     try:
-        # Call periodic memory cleanup
-        analytics_memory_cleanup()
-        conn = sqlite3.connect(database.dbName)
+        conn = get_request_db()
         cursor = conn.cursor()
         
-        # Get most common words/topics from tweet content
-        cursor.execute("""
-            SELECT 
-                tweet_text,
-                COUNT(*) as frequency,
-                DATE(created_at) as last_used
-            FROM tweets 
-            WHERE created_at >= datetime('now', '-30 days')
-            AND sent = 1
-            ORDER BY frequency DESC
-            LIMIT 20
-        """)
-        
-        results = cursor.fetchall()
-        conn.close()
-        
-        # Simple word extraction with memory leak protection
-        word_frequency = {}
-        max_unique_words = 1000  # Limit to prevent unbounded memory growth
-        
-        for content, freq, last_used in results:
-            if content and len(word_frequency) < max_unique_words:
-                # Basic word extraction
-                words = content.lower().split()
-                for word in words:
-                    # Clean word (remove punctuation)
-                    import re
-                    clean_word = re.sub(r'[^\w\sğüşıöçĞÜŞİÖÇ]', '', word)
-                    if len(clean_word) > 3 and not clean_word.startswith('http'):
-                        word_frequency[clean_word] = word_frequency.get(clean_word, 0) + freq
-                        
-                        # Additional protection: stop if dictionary gets too large
-                        if len(word_frequency) >= max_unique_words:
-                            print(f"[WARNING] Word frequency dictionary reached limit ({max_unique_words} words)")
-                            break
+        # SQLite splits and counts the words; only distinct words reach Python
+        word_frequency = collections.Counter()
+        for word, freq in cursor.execute(_SQL_TOPIC_WORDS, (_utc_cutoff(30),)):
+            if word in _STOPWORDS:
+                continue
+            # Python lower() also folds non-ASCII letters that SQLite's lower() leaves
+            clean_word = _WORD_STRIP.sub('', word.lower())
+            if len(clean_word) > 3 and not clean_word.startswith('http') and clean_word not in _STOPWORDS:
+                word_frequency[clean_word] += freq
         
-        # Get top 15 words and clear large dictionary immediately
-        sorted_words = sorted(word_frequency.items(), key=lambda x: x[1], reverse=True)[:15]
-        word_frequency.clear()  # Explicit cleanup to prevent memory retention
+        # Get top 15 words (heap selection)
+        sorted_words = word_frequency.most_common(15)
         
         # Format for word cloud visualization
         data = {
@@ -1994,10 +2385,7 @@ def api_analytics_trending_topics():
             }]
         }
         
-        # Memory cleanup and monitoring
-        gc.collect()  # Force garbage collection to free memory
-        
-        return jsonify({
+        return _json({
             'success': True,
             'data': data,
             'word_cloud_data': [
@@ -2006,60 +2394,69 @@ def api_analytics_trending_topics():
             ],
             'memory_stats': {
                 'words_processed': len(sorted_words),
-                'memory_cleaned': True
+                'unique_words': len(word_frequency)
             }
         })
         
     except Exception as e:
-        return jsonify({
+        return _json({
             'success': False,
             'message': f'Analytics error: {str(e)}'
-        }), 500
+        }, 500)
 
 # Data Export/Import API endpoints
+EXPORT_BATCH_SIZE = 500  # Rows serialized per streamed chunk
 @app.route('/api/export/database', methods=['GET'])
 @login_required
 def api_export_database():
-    """Export complete database to JSON"""
+    """Export complete database to JSON (streamed, rows are never all held in memory)"""
     try:
-        conn = sqlite3.connect(database.dbName)
+        conn = get_request_db()
         cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM tweets")
+        total_tweets = cursor.fetchone()[0]
         
-        # Export tweets table
-        cursor.execute("SELECT * FROM tweets")
-        tweets = cursor.fetchall()
-        
-        # Get column names
-        cursor.execute("PRAGMA table_info(tweets)")
-        columns = [row[1] for row in cursor.fetchall()]
-        
-        conn.close()
-        
-        # Convert to list of dictionaries
-        tweets_data = []
-        for tweet in tweets:
-            tweet_dict = dict(zip(columns, tweet))
-            tweets_data.append(tweet_dict)
-        
-        # Create export data structure
-        export_data = {
-            'export_info': {
+        # Same envelope as before: {success, filename, data: {export_info, configuration, tweets}}
+        head = (
+            b'{"success":true,"filename":'
+            + _dumps(f"twitter_bot_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+            + b',"data":{"export_info":'
+            + _dumps({
                 'timestamp': datetime.now().isoformat(),
                 'version': '1.0',
-                'total_tweets': len(tweets_data)
-            },
-            'tweets': tweets_data,
-            'configuration': {
+                'total_tweets': total_tweets
+            })
+            + b',"configuration":'
+            + _dumps({
                 'database_file': database.dbName,
                 'table_name': 'tweets'
-            }
-        }
+            })
+            + b',"tweets":['
+        )
         
-        return jsonify({
-            'success': True,
-            'data': export_data,
-            'filename': f"twitter_bot_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        })
+        def generate():
+            yield head
+            # Own pooled connection: the generator outlives the view function
+            export_conn = database.get_pooled_connection()
+            try:
+                export_cursor = export_conn.cursor()
+                # Row factory on the cursor only, so the pooled connection keeps returning tuples
+                export_cursor.row_factory = sqlite3.Row
+                export_cursor.arraysize = EXPORT_BATCH_SIZE
+                export_cursor.execute("SELECT * FROM tweets")
+                first = True
+                while True:
+                    rows = export_cursor.fetchmany()
+                    if not rows:
+                        break
+                    chunk = b','.join(_dumps(dict(row)) for row in rows)
+                    yield chunk if first else b',' + chunk
+                    first = False
+            finally:
+                database.put_db_connection(export_conn)
+            yield b']}}'
+        
+        return Response(stream_with_context(generate()), mimetype='application/json')
         
     except Exception as e:
         return jsonify({
@@ -2080,36 +2477,31 @@ def api_import_database():
                 'message': 'Geçersiz import verisi'
             }), 400
         
-        conn = sqlite3.connect(database.dbName)
+        conn = get_request_db()
         cursor = conn.cursor()
         
         # Get existing tweet IDs to avoid duplicates
         cursor.execute("SELECT id FROM tweets")
         existing_ids = set(row[0] for row in cursor.fetchall())
         
-        imported_count = 0
-        skipped_count = 0
-        
-        # Import tweets
-        for tweet_data in import_data['tweets']:
-            if tweet_data.get('id') in existing_ids:
-                skipped_count += 1
-                continue
-            
-            # Insert tweet (let SQLite auto-generate ID if not provided)
-            cursor.execute("""
-                INSERT INTO tweets (tweet_text, tweet_type, sent, created_at)
-                VALUES (?, ?, ?, ?)
-            """, (
+        # Build all new rows first (let SQLite auto-generate IDs)
+        now_iso = datetime.now().isoformat()
+        rows = [
+            (
                 tweet_data.get('tweet_text', tweet_data.get('content', '')),
                 tweet_data.get('tweet_type', 'imported'),
                 1 if tweet_data.get('sent', tweet_data.get('status')) == 'success' or tweet_data.get('sent') == 1 else 0,
-                tweet_data.get('created_at', datetime.now().isoformat())
-            ))
-            imported_count += 1
+                tweet_data.get('created_at', now_iso)
+            )
+            for tweet_data in import_data['tweets']
+            if tweet_data.get('id') not in existing_ids
+        ]
+        imported_count = len(rows)
+        skipped_count = len(import_data['tweets']) - imported_count
         
-        conn.commit()
-        conn.close()
+        # Insert tweets in one transaction (also invalidates cached tweet counts)
+        database.bulk_insert_tweets(rows)
+        invalidate_response_cache()
         
         return jsonify({
             'success': True,
@@ -2130,17 +2522,19 @@ def api_import_database():
 def api_check_status():
     """Check real-time status of all APIs"""
     try:
-        import check_api_status
-        status = check_api_status.get_all_api_status()
-        return jsonify({
+        if check_api_status is None:
+            raise RuntimeError("check_api_status module could not be loaded")
+        # ?refresh=1 (the config page's test button) bypasses the 30 s status cache
+        status = check_api_status.get_all_api_status(use_cache=request.args.get('refresh') != '1')
+        return _json({
             'success': True,
             'status': status
         })
     except Exception as e:
-        return jsonify({
+        return _json({
             'success': False,
             'message': str(e)
-        }), 500
+        }, 500)
 
 # Prompt Management API endpoints
 @app.route('/api/prompts', methods=['GET'])
@@ -2189,6 +2583,7 @@ def api_update_prompt(prompt_type):
         success = database.update_prompt(prompt_type, prompt_text, description)
         
         if success:
+            invalidate_prompts_cache()
             return jsonify({
                 'success': True,
                 'message': f'{prompt_type} prompt güncellendi'
@@ -2213,6 +2608,7 @@ def api_toggle_prompt(prompt_type):
         success = database.toggle_prompt_status(prompt_type)
         
         if success:
+            invalidate_prompts_cache()
             return jsonify({
                 'success': True,
                 'message': f'{prompt_type} prompt durumu değiştirildi'
@@ -2311,72 +2707,53 @@ def api_update_persona_setting(setting_key):
             'message': f'Setting update error: {str(e)}'
         }), 500
 
+_SQL_REALTIME_STATS = """
+    WITH last100 AS (
+        SELECT sent FROM tweets
+        ORDER BY created_at DESC
+        LIMIT 100
+    )
+    SELECT
+        (SELECT COUNT(*) FROM last100),
+        (SELECT SUM(CASE WHEN sent = 1 THEN 1 ELSE 0 END) FROM last100),
+        (SELECT COUNT(*) FROM tweets WHERE created_at >= ?),
+        (SELECT CAST(strftime('%s', MAX(created_at)) AS INTEGER) FROM tweets WHERE sent = 1)
+"""
+
 @app.route('/api/realtime_stats')
 @login_required
 def get_realtime_stats():
     """Get real-time statistics for monitoring page"""
     try:
-        import sqlite3
-        from datetime import datetime, timedelta
-
         stats = {}
 
-        # Get success rate from database
-        conn = sqlite3.connect(database.dbName)
-        cursor = conn.cursor()
+        # Success rate of the last 100 tweets, today's count and last sent tweet in one query
+        today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        total, successful, api_calls, last_sent_ts = get_request_db().execute(
+            _SQL_REALTIME_STATS, (today_start.isoformat(),)
+        ).fetchone()
 
-        # Calculate success rate from last 100 tweets
-        cursor.execute("""
-            SELECT
-                COUNT(*) as total,
-                SUM(CASE WHEN sent = 1 THEN 1 ELSE 0 END) as successful
-            FROM (
-                SELECT sent FROM tweets
-                ORDER BY created_at DESC
-                LIMIT 100
-            )
-        """)
-        result = cursor.fetchone()
-        if result and result[0] > 0:
-            stats['success_rate'] = round((result[1] / result[0]) * 100, 1)
+        if total:
+            stats['success_rate'] = round((successful / total) * 100, 1)
         else:
             stats['success_rate'] = 100.0
 
         # Count API calls today
-        today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        cursor.execute("""
-            SELECT COUNT(*) FROM tweets
-            WHERE created_at >= ?
-        """, (today_start.isoformat(),))
-        stats['api_calls'] = cursor.fetchone()[0]
-
-        cursor.close()
-        conn.close()
+        stats['api_calls'] = api_calls
 
         # Calculate bot uptime
-        if bot_stats["running"] and bot_stats["start_time"]:
-            start_time = datetime.fromisoformat(bot_stats["start_time"])
-            uptime_seconds = int((datetime.now() - start_time).total_seconds())
-            stats['bot_uptime'] = uptime_seconds
+        if bot_running and bot_start_ts:
+            stats['bot_uptime'] = int(time.time() - bot_start_ts)
         else:
             stats['bot_uptime'] = 0
 
         # Calculate next tweet time
-        if bot_stats["running"] and bot_stats["start_time"]:
-            cycle_minutes = get_int_config("CYCLE_DURATION_MINUTES", 60)
+        if bot_running and bot_start_ts:
+            cycle_minutes = _cfg_int("CYCLE_DURATION_MINUTES", 60)
 
-            # Find last tweet time
-            conn = sqlite3.connect(database.dbName)
-            cursor = conn.cursor()
-            cursor.execute("SELECT created_at FROM tweets WHERE sent = 1 ORDER BY created_at DESC LIMIT 1")
-            last_tweet = cursor.fetchone()
-            cursor.close()
-            conn.close()
-
-            if last_tweet:
-                last_tweet_time = datetime.fromisoformat(last_tweet[0].replace(' ', 'T'))
-                next_run = last_tweet_time + timedelta(minutes=cycle_minutes)
-                time_remaining = (next_run - datetime.now()).total_seconds()
+            # Last sent tweet as a Unix timestamp (SQLite converts it in the query above)
+            if last_sent_ts:
+                time_remaining = last_sent_ts + cycle_minutes * 60 - time.time()
 
                 if time_remaining > 0:
                     minutes = int(time_remaining // 60)
@@ -2389,13 +2766,13 @@ def get_realtime_stats():
         else:
             stats['next_tweet_time'] = "--:--"
 
-        return jsonify({
+        return _json({
             'success': True,
             'stats': stats
         })
 
     except Exception as e:
-        return jsonify({
+        return _json({
             'success': False,
             'message': str(e),
             'stats': {
@@ -2406,127 +2783,138 @@ def get_realtime_stats():
             }
         })
 
+_SQL_RECENT_ACTIVITY = """
+    SELECT tweet_text, tweet_type, sent, created_at, tweet_time
+    FROM tweets
+    ORDER BY id DESC
+    LIMIT 5
+"""
+
+def _build_activities(tweets):
+    """Turn the last tweets into activity feed entries"""
+    activities = []
+    
+    for text, tweet_type, success, created_at, time in tweets:
+        # Generate activity entry based on tweet data
+        if success:
+            activity = {
+                'time': time or created_at,
+                'icon': 'fas fa-paper-plane',
+                'message': f'Tweet gönderildi: "{text[:50]}{"..." if len(text) > 50 else ""}"',
+                'type': 'success'
+            }
+        else:
+            activity = {
+                'time': time or created_at,
+                'icon': 'fas fa-exclamation-triangle',
+                'message': f'Tweet gönderilemeđi: "{text[:50]}{"..." if len(text) > 50 else ""}"',
+                'type': 'error'
+            }
+        
+        activities.append(activity)
+    
+    # Add some simulated bot activities if no tweets
+    if not activities:
+        current_time = datetime.now().strftime('%H:%M')
+        activities = [
+            {
+                'time': current_time,
+                'icon': 'fas fa-robot',
+                'message': 'Bot izleme sistemi aktif',
+                'type': 'info'
+            },
+            {
+                'time': '14:30',
+                'icon': 'fas fa-chart-line',
+                'message': 'Sistem durumu kontrol edildi',
+                'type': 'info'
+            }
+        ]
+    
+    return activities[:5]  # Max 5 activity
+
+DB_SIZE_TTL = 10.0  # seconds; the UI does not need byte-exact growth
+_db_size_cache = (0, 0.0)  # (size_bytes, expires)
+
+def _database_size_bytes():
+    """Database size including the WAL and shared-memory files, cached for DB_SIZE_TTL"""
+    global _db_size_cache
+    now = time.monotonic()
+    if now < _db_size_cache[1]:
+        return _db_size_cache[0]
+    size_bytes = 0
+    for path in (database.dbName, database.dbName + '-wal', database.dbName + '-shm'):
+        try:
+            size_bytes += os.stat(path).st_size  # One syscall instead of exists() + getsize()
+        except OSError:
+            pass
+    _db_size_cache = (size_bytes, now + DB_SIZE_TTL)
+    return size_bytes
+
+def _database_size_str():
+    """Human-readable database file size"""
+    size_bytes = _database_size_bytes()
+    if not size_bytes:
+        return "0 KB"
+    
+    # Format size
+    if size_bytes < 1024:
+        return f"{size_bytes} B"
+    elif size_bytes < 1024 * 1024:
+        return f"{size_bytes / 1024:.1f} KB"
+    return f"{size_bytes / (1024 * 1024):.1f} MB"
+
+def _format_tr_number(n):
+    """Turkish thousands format (1.234.567)"""
+    return f"{n:_}".replace('_', '.')
+
 @app.route('/api/activity', methods=['GET'])
+@cached_endpoint()
 def get_recent_activity():
     """Get recent bot activity logs"""
     try:
-        conn = sqlite3.connect(database.dbName)
-        cursor = conn.cursor()
-        
         # Get last 5 tweets with their details
-        cursor.execute("""
-            SELECT tweet_text, tweet_type, sent, created_at, tweet_time
-            FROM tweets 
-            ORDER BY id DESC 
-            LIMIT 5
-        """)
-        
-        tweets = cursor.fetchall()
-        conn.close()
-        
-        activities = []
-        
-        if tweets:
-            for tweet in tweets:
-                text, tweet_type, success, created_at, time = tweet
-                
-                # Generate activity entry based on tweet data
-                if success:
-                    activity = {
-                        'time': time or created_at,
-                        'icon': 'fas fa-paper-plane',
-                        'message': f'Tweet gönderildi: "{text[:50]}{"..." if len(text) > 50 else ""}"',
-                        'type': 'success'
-                    }
-                else:
-                    activity = {
-                        'time': time or created_at,
-                        'icon': 'fas fa-exclamation-triangle',
-                        'message': f'Tweet gönderilemeđi: "{text[:50]}{"..." if len(text) > 50 else ""}"',
-                        'type': 'error'
-                    }
-                
-                activities.append(activity)
-        
-        # Add some simulated bot activities if no tweets
-        if not activities:
-            from datetime import datetime
-            current_time = datetime.now().strftime('%H:%M')
-            activities = [
-                {
-                    'time': current_time,
-                    'icon': 'fas fa-robot',
-                    'message': 'Bot izleme sistemi aktif',
-                    'type': 'info'
-                },
-                {
-                    'time': '14:30',
-                    'icon': 'fas fa-chart-line',
-                    'message': 'Sistem durumu kontrol edildi',
-                    'type': 'info'
-                }
-            ]
+        tweets = get_request_db().execute(_SQL_RECENT_ACTIVITY).fetchall()
         
-        return jsonify({
+        return _json({
             'success': True,
-            'activities': activities[:5]  # Max 5 activity
+            'activities': _build_activities(tweets)
         })
         
     except Exception as e:
-        return jsonify({
+        return _json({
             'success': False,
             'message': f'Aktivite verileri alınamadı: {str(e)}'
-        }), 500
+        }, 500)
 
 @app.route('/api/database/stats', methods=['GET'])
+@cached_endpoint()
 def get_database_stats():
     """Get database file size and record count"""
     try:
-        import os
-        
-        # Get database file size
-        db_path = database.dbName
-        if os.path.exists(db_path):
-            size_bytes = os.path.getsize(db_path)
-            
-            # Format size
-            if size_bytes < 1024:
-                size_str = f"{size_bytes} B"
-            elif size_bytes < 1024 * 1024:
-                size_str = f"{size_bytes / 1024:.1f} KB"
-            else:
-                size_str = f"{size_bytes / (1024 * 1024):.1f} MB"
-        else:
-            size_str = "0 KB"
+        total_tweets = database.get_tweet_count(get_request_db())  # Trigger-maintained counter, O(1)
         
-        # Get total tweet count
-        conn = sqlite3.connect(database.dbName)
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM tweets")
-        total_tweets = cursor.fetchone()[0]
-        conn.close()
-        
-        return jsonify({
+        return _json({
             'success': True,
-            'size': size_str,
-            'total_tweets': f"{total_tweets:,}".replace(',', '.')  # Turkish number format
+            'size': _database_size_str(),
+            'total_tweets': _format_tr_number(total_tweets)
         })
         
     except Exception as e:
-        return jsonify({
+        return _json({
             'success': False,
             'message': f'Database stats error: {str(e)}'
-        }), 500
+        }, 500)
 
 # Error handlers
 @app.errorhandler(CSRFError)
 def handle_csrf_error(e):
     """Handle CSRF token errors"""
-    return jsonify({
+    return _json({
         'success': False,
         'message': 'CSRF token hatası. Sayfayı yenileyip tekrar deneyin.',
         'error_type': 'csrf_error'
-    }), 400
+    }, 400)
 
 @app.errorhandler(404)
 def not_found_error(error):
@@ -2542,7 +2930,19 @@ def internal_error(error):
                          error_code=500, 
                          error_message="Sunucu hatası"), 500
 
-# Input validation utilities
+# Input validation utilities - patterns compiled once for every outbound tweet
+# Mentions/hashtags stop where a URL starts ('#AIhttps://t.co/x' -> '#AI' + URL) so the
+# URL still gets its t.co length, exactly as when each pattern was scanned separately
+_ENTITY_RE = re.compile(
+    r'(?P<url>https?://\S+)'
+    r'|(?P<mention>@(?!https?://)\w+?(?=https?://|\W|$))'
+    r'|(?P<hashtag>#(?!https?://)\w+?(?=https?://|\W|$))'
+)
+_DANGER_RE = re.compile(r'<script|javascript:|data:', re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]*>')
+_JS_RE = re.compile(r'javascript:', re.IGNORECASE)
+_DATA_RE = re.compile(r'data:', re.IGNORECASE)
+
 def calculate_twitter_length(text):
     """
     Calculate the actual length of a tweet accounting for Twitter's URL shortening.
@@ -2555,30 +2955,27 @@ def calculate_twitter_length(text):
     Returns:
         int: Calculated tweet length according to Twitter's counting rules
     """
-    import re
-    
     # Twitter's current t.co URL length (as of 2024)
     TCO_URL_LENGTH = 23
     
-    # Find all URLs in the text
-    url_pattern = r'https?://[^\s]+'
-    urls = re.findall(url_pattern, text)
-    
-    # Start with the original text length
-    calculated_length = len(text)
-    
-    # Find mentions and hashtags for reporting
-    mentions = re.findall(r'@\w+', text)
-    hashtags = re.findall(r'#\w+', text)
-    
-    # Replace each URL with Twitter's t.co equivalent length
-    for url in urls:
-        original_url_length = len(url)
-        # Subtract original URL length and add t.co length
-        calculated_length = calculated_length - original_url_length + TCO_URL_LENGTH
+    # One scan for URLs, mentions and hashtags; '@'/'#' inside a URL belong to the URL
+    urls = []
+    mentions = []
+    hashtags = []
+    delta = 0
+    for match in _ENTITY_RE.finditer(text):
+        kind = match.lastgroup
+        if kind == 'url':
+            urls.append(match.group())
+            # Replace the URL's length with Twitter's t.co equivalent length
+            delta += TCO_URL_LENGTH - (match.end() - match.start())
+        elif kind == 'mention':
+            mentions.append(match.group())
+        else:
+            hashtags.append(match.group())
     
     return {
-        'length': calculated_length,
+        'length': len(text) + delta,
         'url_count': len(urls),
         'mention_count': len(mentions),
         'hashtag_count': len(hashtags),
@@ -2603,9 +3000,9 @@ def validate_tweet_text(text):
     if len(text) > 2000:
         return False, "Tweet çok uzun (muhtemelen hata)"
     
-    # Remove potentially harmful content
-    import re
-    if re.search(r'<script|javascript:|data:', text, re.IGNORECASE):
+    # Remove potentially harmful content - every pattern contains '<' or ':',
+    # so clean text skips the regex engine entirely
+    if ('<' in text or ':' in text) and _DANGER_RE.search(text):
         return False, "Geçersiz karakter dizisi"
     
     # Create detailed validation message
@@ -2619,42 +3016,20 @@ def validate_tweet_text(text):
     
     return True, message
 
-def test_twitter_length_calculation():
-    """Test Twitter length calculation with various content types"""
-    test_cases = [
-        ("Hello world!", 12),
-        ("Check this out: https://example.com/very-long-url-that-will-be-shortened", 23 + 17),  # URL shortened to 23
-        ("@username how are you?", 20),  # Mention counts as full
-        ("#hashtag #trending now", 19),  # Hashtags count as full  
-        ("Visit https://example.com and https://test.com", 23 + 5 + 23),  # Two URLs
-        ("Hello @user1 @user2 #tech https://example.com", len("Hello @user1 @user2 #tech ") + 23),
-    ]
-    
-    print("[INFO] Testing Twitter length calculation:")
-    for text, expected in test_cases:
-        result = calculate_twitter_length(text)
-        actual = result['length']
-        status = "✓" if actual == expected else "✗"
-        print(f"  {status} '{text}' -> {actual} chars (expected: {expected})")
-        if result['url_count'] > 0:
-            print(f"    URLs: {result['urls']}")
-        if result['mention_count'] > 0:
-            print(f"    Mentions: {result['mentions']}")
-        if result['hashtag_count'] > 0:
-            print(f"    Hashtags: {result['hashtags']}")
-    
-    return True
-
 def sanitize_input(text):
     """Sanitize user input"""
     if not text:
         return ""
     
-    # Remove HTML tags and scripts
-    import re
-    text = re.sub(r'<[^>]*>', '', text)
-    text = re.sub(r'javascript:', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'data:', '', text, flags=re.IGNORECASE)
+    # Fast path: nothing to strip without '<' or ':'
+    if '<' not in text and ':' not in text:
+        return text.strip()
+    
+    # Remove HTML tags and scripts (kept as separate passes so removing one
+    # pattern cannot splice together another, e.g. 'dajavascript:ta:')
+    text = _TAG_RE.sub('', text)
+    text = _JS_RE.sub('', text)
+    text = _DATA_RE.sub('', text)
     
     return text.strip()
 
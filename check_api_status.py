@@ -4,33 +4,71 @@ Check real-time API connection status
 
 import time
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from dotenv import load_dotenv
 import tweepy
 import google.generativeai as genai
 import requests
+from requests.adapters import HTTPAdapter
 from config import get_config
+import database
 
 # Load environment variables
 load_dotenv("token.env")
 
+# Independent I/O checks run concurrently; each one gets at most this many seconds
+# (also passed to the tweepy/Gemini clients so a timed-out check doesn't hang on)
+API_CHECK_TIMEOUT = 10
+
+# Clients reused across health checks; rebuilt only when the credentials change
+_client_lock = threading.Lock()
+_twitter_client = {"key": None, "api": None}
+_gemini_client = {"key": None, "model": None}
+
+# Keep-alive HTTP session for the trends check
+_HTTP = requests.Session()
+_HTTP.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_HTTP.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+def _get_twitter_api(credentials):
+    """Return a cached tweepy.API for these credentials"""
+    with _client_lock:
+        if _twitter_client["key"] != credentials:
+            api_key, api_secret, access_token, access_token_secret = credentials
+            auth = tweepy.OAuthHandler(api_key, api_secret)
+            auth.set_access_token(access_token, access_token_secret)
+            _twitter_client["api"] = tweepy.API(auth, timeout=API_CHECK_TIMEOUT)
+            _twitter_client["key"] = credentials
+        return _twitter_client["api"]
+
+def _get_gemini_model(gemini_api_key):
+    """Return a cached GenerativeModel, configuring the SDK only when the key changes"""
+    with _client_lock:
+        if _gemini_client["key"] != gemini_api_key:
+            genai.configure(api_key=gemini_api_key)
+            _gemini_client["model"] = genai.GenerativeModel('gemini-2.5-flash')
+            _gemini_client["key"] = gemini_api_key
+        return _gemini_client["model"]
+
 def check_twitter_api():
     """Check Twitter API connection status"""
     try:
         start = time.time()
 
         # Get credentials
-        api_key = get_config("api_key")
-        api_secret = get_config("api_secret")
-        access_token = get_config("access_token")
-        access_token_secret = get_config("access_token_secret")
-
-        if not all([api_key, api_secret, access_token, access_token_secret]):
+        credentials = (
+            get_config("api_key"),
+            get_config("api_secret"),
+            get_config("access_token"),
+            get_config("access_token_secret"),
+        )
+
+        if not all(credentials):
             return {"status": "error", "message": "Missing credentials", "ping": None}
 
-        # Test connection
-        auth = tweepy.OAuthHandler(api_key, api_secret)
-        auth.set_access_token(access_token, access_token_secret)
-        api = tweepy.API(auth)
+        # Test connection (client reused between checks)
+        api = _get_twitter_api(credentials)
 
         # Verify credentials
         api.verify_credentials()
@@ -54,12 +92,9 @@ def check_gemini_api():
         if not gemini_api_key:
             return {"status": "error", "message": "Missing API key", "ping": None}
 
-        # Configure Gemini
-        genai.configure(api_key=gemini_api_key)
-
-        # Test with a simple prompt
-        model = genai.GenerativeModel('gemini-2.5-flash')
-        response = model.generate_content("Test")
+        # Test with a simple prompt (model reused between checks)
+        model = _get_gemini_model(gemini_api_key)
+        response = model.generate_content("Test", request_options={"timeout": API_CHECK_TIMEOUT})
 
         if response:
             ping = int((time.time() - start) * 1000)  # Convert to ms
@@ -79,7 +114,7 @@ def check_trends_api():
         trends_url = get_config("TRENDS_URL", "https://xtrends.iamrohit.in/turkey")
 
         # Test connection
-        response = requests.get(trends_url, timeout=5)
+        response = _HTTP.get(trends_url, timeout=5)
 
         if response.status_code == 200:
             ping = int((time.time() - start) * 1000)  # Convert to ms
@@ -95,21 +130,15 @@ def check_trends_api():
 def check_database():
     """Check database connection status"""
     try:
-        import sqlite3
-        from config import get_config
-
         start = time.time()
 
-        db_name = get_config("DB_NAME", "twitter.db")
-        conn = sqlite3.connect(db_name)
-
-        # Test query
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM tweets")
-        result = cursor.fetchone()
+        # Reuse a pooled connection instead of opening a new one per check
+        with database.pooled_connection() as conn:
+            if conn is None:
+                return {"status": "error", "message": "Connection failed", "ping": None}
 
-        cursor.close()
-        conn.close()
+            # Test query
+            result = conn.execute("SELECT COUNT(*) FROM tweets").fetchone()
 
         ping = int((time.time() - start) * 1000)  # Convert to ms
         return {"status": "success", "message": f"Connected ({result[0]} tweets)", "ping": ping}
@@ -117,20 +146,53 @@ def check_database():
     except Exception as e:
         return {"status": "error", "message": str(e), "ping": None}
 
-def get_all_api_status():
-    """Get status of all APIs"""
-    return {
-        "twitter": check_twitter_api(),
-        "gemini": check_gemini_api(),
-        "trends": check_trends_api(),
-        "database": check_database()
-    }
+_API_CHECKS = (
+    ("twitter", check_twitter_api),
+    ("gemini", check_gemini_api),
+    ("trends", check_trends_api),
+    ("database", check_database),
+)
+
+# Health results are reused for this many seconds - each check is a real network round-trip
+API_STATUS_TTL = 30
+_status_cache = {"expires": 0.0, "value": None}
+_status_lock = threading.Lock()
+
+# Shared, fixed-size pool: a check that outlives its timeout occupies one of these
+# workers instead of leaking a new thread per round
+_check_executor = ThreadPoolExecutor(max_workers=len(_API_CHECKS), thread_name_prefix="api-check")
+
+def _run_checks():
+    """Run every check concurrently; wall-clock time is the slowest check, capped by API_CHECK_TIMEOUT"""
+    futures = {name: _check_executor.submit(check) for name, check in _API_CHECKS}
+    deadline = time.monotonic() + API_CHECK_TIMEOUT
+    status = {}
+    for name, future in futures.items():
+        try:
+            status[name] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            future.cancel()  # Drops it if it never started (pool busy with a stuck check)
+            status[name] = {"status": "error", "message": "Timeout", "ping": None}
+    return status
+
+def get_all_api_status(use_cache=True):
+    """Get status of all APIs (cached for API_STATUS_TTL seconds)"""
+    # The lock only guards the cache - network checks run outside it so readers never wait on them
+    if use_cache:
+        with _status_lock:
+            if _status_cache["value"] is not None and time.monotonic() < _status_cache["expires"]:
+                return _status_cache["value"]
+    status = _run_checks()
+    with _status_lock:
+        _status_cache["value"] = status
+        _status_cache["expires"] = time.monotonic() + API_STATUS_TTL
+    return status
 
 if __name__ == "__main__":
     print("[API Status Check]")
     print("=" * 50)
 
-    status = get_all_api_status()
+    status = get_all_api_status(use_cache=False)
 
     for api_name, api_status in status.items():
         status_icon = "✅" if api_status["status"] == "success" else "⚠️" if api_status["status"] == "warning" else "❌"
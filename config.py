@@ -29,9 +29,12 @@ class ConfigManager:
             with self._lock:
                 if not self._initialized:
                     self._config_cache = {}
+                    self._typed_cache = {}  # (kind, key, default) -> parsed value
                     self._last_reload = 0
                     self._reload_interval = 300  # 5 minutes
+                    self._reload_timer = None
                     self._load_config()
+                    self._schedule_reload()
                     self._initialized = True
     
     def _load_config(self):
@@ -39,41 +42,76 @@ class ConfigManager:
         try:
             # Use override=True to force reload of changed values
             load_dotenv("token.env", override=True)
+            # Snapshot the environment; readers swap to the new dicts atomically
+            self._config_cache = dict(os.environ)
+            self._typed_cache = {}
             self._last_reload = time.time()
             print("[CONFIG] Environment variables reloaded successfully")
         except Exception as e:
             print(f"[CONFIG ERROR] Failed to load environment: {e}")
     
+    def _schedule_reload(self):
+        """Reload periodically from a background timer instead of checking the clock in get()"""
+        timer = threading.Timer(self._reload_interval, self._timed_reload)
+        timer.daemon = True
+        timer.start()
+        self._reload_timer = timer
+    
+    def _timed_reload(self):
+        """Timer callback - reload, then re-arm"""
+        with self._lock:
+            self._load_config()
+        self._schedule_reload()
+    
     def get(self, key, default=None, force_reload=False):
-        """Get configuration value with optional caching"""
-        current_time = time.time()
-        
-        # Check if reload is needed
-        if force_reload or (current_time - self._last_reload > self._reload_interval):
+        """Get configuration value from the cached environment snapshot"""
+        if force_reload:
             with self._lock:
-                if force_reload or (current_time - self._last_reload > self._reload_interval):
-                    self._load_config()
+                self._load_config()
         
-        return os.getenv(key, default)
+        return self._config_cache.get(key, default)
     
     def get_int(self, key, default=0):
         """Get integer configuration value with error handling"""
+        cache_key = ('int', key, default)
+        typed = self._typed_cache  # Keep writing to this snapshot even if a reload swaps it
+        try:
+            return typed[cache_key]
+        except KeyError:
+            pass
         try:
-            return int(self.get(key, str(default)))
+            value = int(self.get(key, str(default)))
         except (ValueError, TypeError):
-            return default
+            value = default
+        typed[cache_key] = value
+        return value
     
     def get_float(self, key, default=0.0):
         """Get float configuration value with error handling"""
+        cache_key = ('float', key, default)
+        typed = self._typed_cache  # Keep writing to this snapshot even if a reload swaps it
+        try:
+            return typed[cache_key]
+        except KeyError:
+            pass
         try:
-            return float(self.get(key, str(default)))
+            value = float(self.get(key, str(default)))
         except (ValueError, TypeError):
-            return default
+            value = default
+        typed[cache_key] = value
+        return value
     
     def get_bool(self, key, default=False):
         """Get boolean configuration value"""
-        value = self.get(key, '').lower()
-        return value in ('true', '1', 'yes', 'on')
+        cache_key = ('bool', key)
+        typed = self._typed_cache  # Keep writing to this snapshot even if a reload swaps it
+        try:
+            return typed[cache_key]
+        except KeyError:
+            pass
+        value = self.get(key, '').lower() in ('true', '1', 'yes', 'on')
+        typed[cache_key] = value
+        return value
     
     def get_list(self, key, default=None, separator=','):
         """Get list configuration value by splitting string"""
@@ -95,6 +133,10 @@ class ConfigManager:
 # Global singleton instance
 config = ConfigManager()
 
+# Timer threads do not survive fork (gunicorn preload) - re-arm the reload timer in the child
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=config._schedule_reload)
+
 # Convenience functions for backward compatibility
 def get_config(key, default=None):
     """Get configuration value"""
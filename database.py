@@ -2,12 +2,18 @@ import sqlite3          # Built-in SQLite database interface
 import datetime as dt   # For timestamp generation
 import os              # For environment variable access
 import threading       # For thread-safe database operations
+import queue           # Connection pool storage
+import atexit          # Close pooled connections on shutdown
+from contextlib import contextmanager  # with-statement access to pooled connections
 from config import get_config  # Centralized configuration
 
 # Database Configuration - customizable via environment variables
 dbName = get_config("DB_NAME", "twitter.db")      # Database file name (default: twitter.db)
 tableName = get_config("TABLE_NAME", "tweets")    # Table name for storing tweets (default: tweets)
 
+# Bump whenever createDatabase() gains new DDL or seed data; stored in PRAGMA user_version
+SCHEMA_VERSION = 1
+
 # SECURITY: Whitelist of allowed table names to prevent SQL injection
 ALLOWED_TABLE_NAMES = {'tweets', 'prompts', 'persona_settings', 'test_tweets'}
 
@@ -41,9 +47,28 @@ if not validate_table_name(tableName):
     print(f"[ERROR] Configured table name '{tableName}' is not allowed. Using default 'tweets'")
     tableName = "tweets"
 
+# tableName is fixed from here on - validate it once instead of on every insert
+_TABLE_NAME_VALID = validate_table_name(tableName)
+
+# Parameterized tweet insert, built once
+# Note: Table name is validated against whitelist, so f-string is safe here
+_Q_INSERT_TWEET = f"""
+                    INSERT INTO {tableName} (tweet_text,tweet_type,sent,tweet_time,tweet_date,tweet_day)
+                    VALUES (?,?,?,?,?,?)
+                """
+
 # Thread safety for database operations
 db_lock = threading.Lock()
 
+# Bumped on every tweet insert so readers can tell cached counts are stale
+tweets_generation = 0
+
+# Bumped on every prompt/persona change; get_active_prompts_dict() caches against it
+prompts_generation = 0
+_active_prompts_cache = {"entry": None}  # (generation, formatted prompts), swapped as one tuple
+
+_TWEET_TIME_FORMAT = "%H:%M:%S|%Y-%m-%d|%A"  # time | date | day name
+
 def get_tweet_time():
     """
     Generate formatted timestamp components for tweet logging.
@@ -54,10 +79,8 @@ def get_tweet_time():
                - tweet_date: Date in ISO format YYYY-MM-DD  
                - tweet_day: Full day name (e.g., Thursday)
     """
-    now = dt.datetime.now()  # Get current datetime
-    tweet_time = now.strftime("%H:%M:%S")       # ISO format: 14:30:45
-    tweet_date = now.strftime("%Y-%m-%d")       # ISO format: 2025-08-30
-    tweet_day = now.strftime("%A")              # Format: Thursday
+    # One strftime pass: "14:30:45|2025-08-30|Thursday"
+    tweet_time, tweet_date, tweet_day = dt.datetime.now().strftime(_TWEET_TIME_FORMAT).split("|")
 
     return tweet_time, tweet_date, tweet_day
 
@@ -70,8 +93,12 @@ def get_db_connection():
                                    None if connection fails
     """
     try:
-        # Connect to SQLite database with thread-safe settings
-        conn = sqlite3.connect(dbName, check_same_thread=False)
+        # Connect to SQLite database with thread-safe settings; a larger
+        # statement cache keeps every helper's SQL prepared on pooled connections.
+        # isolation_level="IMMEDIATE" makes the implicit BEGIN before a write take
+        # the write lock up front, so a transaction never fails to upgrade mid-way
+        conn = sqlite3.connect(dbName, check_same_thread=False, cached_statements=256,
+                               isolation_level="IMMEDIATE")
         
         # Enable WAL mode for better concurrency
         conn.execute('PRAGMA journal_mode=WAL;')
@@ -79,6 +106,15 @@ def get_db_connection():
         # Set timeout for concurrent access
         conn.execute('PRAGMA busy_timeout=30000;')  # 30 seconds
         
+        # WAL makes NORMAL durable across app crashes and avoids an fsync per commit
+        conn.execute('PRAGMA synchronous=NORMAL;')
+        
+        # Per-connection read tuning: in-memory temp tables, 256 MB mmap, ~20 MB page cache
+        # (the mapping is shared OS page cache, so pooled connections don't multiply it)
+        conn.execute('PRAGMA temp_store=MEMORY;')
+        conn.execute('PRAGMA mmap_size=268435456;')
+        conn.execute('PRAGMA cache_size=-20000;')
+        
         print("[+] Database Connected (Thread-safe)")
         return conn 
     except Exception as e:
@@ -86,6 +122,156 @@ def get_db_connection():
         print(f"[-] Connection Failed. {e}")
         return None
 
+# Connection pool - reuses open connections instead of reconnecting per request
+POOL_SIZE = 16
+_connection_pool = queue.LifoQueue(maxsize=POOL_SIZE)
+
+# Separate query_only connections for SELECT-only helpers - under WAL they read
+# concurrently with the writer instead of waiting behind it for a pooled connection
+READ_POOL_SIZE = 4
+_read_pool = queue.LifoQueue(maxsize=READ_POOL_SIZE)
+
+def _reset_connection_pool():
+    """Drop pooled connections inherited from the parent process after fork"""
+    global _connection_pool, _read_pool
+    _connection_pool = queue.LifoQueue(maxsize=POOL_SIZE)
+    _read_pool = queue.LifoQueue(maxsize=READ_POOL_SIZE)
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_connection_pool)
+
+def get_pooled_connection():
+    """
+    Take a connection from the pool, opening a new one if the pool is empty.
+    
+    Returns:
+        sqlite3.Connection: Connection to return with put_db_connection(),
+                           or None if connecting fails
+    """
+    try:
+        return _connection_pool.get_nowait()
+    except queue.Empty:
+        return get_db_connection()
+
+def put_db_connection(conn):
+    """
+    Return a connection to the pool, closing it if the pool is full.
+    
+    Args:
+        conn (sqlite3.Connection): Connection obtained from get_pooled_connection()
+    """
+    if conn is None:
+        return
+    try:
+        conn.rollback()  # Discard anything the caller left uncommitted
+        _connection_pool.put_nowait(conn)
+    except (queue.Full, sqlite3.Error):
+        conn.close()
+
+def get_read_connection():
+    """
+    Take a read-only connection from the reader pool, opening one if it is empty.
+    
+    Returns:
+        sqlite3.Connection: query_only connection to return with put_read_connection(),
+                           or None if connecting fails
+    """
+    try:
+        return _read_pool.get_nowait()
+    except queue.Empty:
+        conn = get_db_connection()
+        if conn is not None:
+            conn.execute('PRAGMA query_only=1;')  # Any write attempt fails instead of taking the write lock
+        return conn
+
+def put_read_connection(conn):
+    """
+    Return a connection to the reader pool, closing it if the pool is full.
+    
+    Args:
+        conn (sqlite3.Connection): Connection obtained from get_read_connection()
+    """
+    if conn is None:
+        return
+    try:
+        conn.rollback()  # End the read transaction so the WAL can checkpoint past it
+        _read_pool.put_nowait(conn)
+    except (queue.Full, sqlite3.Error):
+        conn.close()
+
+@contextmanager
+def pooled_connection():
+    """
+    Borrow a pooled connection for the duration of a with-block.
+    
+    Yields:
+        sqlite3.Connection: Pooled connection, or None if connecting fails.
+                           It is returned to the pool when the block exits.
+    """
+    conn = get_pooled_connection()
+    try:
+        yield conn
+    finally:
+        put_db_connection(conn)
+
+def close_pooled_connections():
+    """
+    Close every idle connection in both pools (registered to run at exit).
+    """
+    for pool in (_connection_pool, _read_pool):
+        while True:
+            try:
+                conn = pool.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+atexit.register(close_pooled_connections)
+
+def _create_tweet_counter(cursor):
+    """
+    Create the meta table holding the tweet row count and the triggers that keep it current.
+    
+    The count is seeded from COUNT(*) only when the row does not exist yet; after that the
+    AFTER INSERT / AFTER DELETE triggers adjust it, so reads are a single primary-key lookup.
+    
+    Args:
+        cursor (sqlite3.Cursor): Cursor inside the createDatabase() transaction
+    """
+    cursor.execute("""CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                );""")
+    cursor.execute(f"INSERT OR IGNORE INTO meta (key, value) SELECT 'tweet_count', COUNT(*) FROM {tableName}")
+    cursor.execute(f"""CREATE TRIGGER IF NOT EXISTS trg_{tableName}_count_insert
+                    AFTER INSERT ON {tableName}
+                    BEGIN UPDATE meta SET value = value + 1 WHERE key = 'tweet_count'; END;""")
+    cursor.execute(f"""CREATE TRIGGER IF NOT EXISTS trg_{tableName}_count_delete
+                    AFTER DELETE ON {tableName}
+                    BEGIN UPDATE meta SET value = value - 1 WHERE key = 'tweet_count'; END;""")
+
+def get_tweet_count(conn):
+    """
+    Read the trigger-maintained tweet count.
+    
+    Args:
+        conn (sqlite3.Connection): Open database connection
+        
+    Returns:
+        int: Number of rows in the tweets table. Falls back to COUNT(*) when the
+             meta counter has not been created yet (createDatabase() not run).
+    """
+    try:
+        row = conn.execute("SELECT value FROM meta WHERE key = 'tweet_count'").fetchone()
+        if row is not None:
+            return row[0]
+    except sqlite3.OperationalError:
+        pass  # meta table missing
+    return conn.execute(f"SELECT COUNT(*) FROM {tableName}").fetchone()[0]
+
 def createDatabase():
     """
     Create the SQLite database and tweets table if they don't exist.
@@ -107,10 +293,22 @@ def createDatabase():
     try:
         cursor = db.cursor()
         # SECURITY: Validate table name before using in SQL
-        if not validate_table_name(tableName):
+        if not _TABLE_NAME_VALID:
             print(f"[ERROR] Cannot create table with invalid name: {tableName}")
             return
             
+        # Schema already built at this version for the configured table - skip the DDL
+        # (the counter trigger is created last, so it marks a complete tweets-table setup)
+        schema_version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        if schema_version == SCHEMA_VERSION and cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = ?",
+                (f"trg_{tableName}_count_delete",)).fetchone():
+            print(f"[+] Database- {dbName} schema v{SCHEMA_VERSION} is up to date.")
+            return
+        
+        # All DDL and seeding below runs in one transaction
+        cursor.execute("BEGIN IMMEDIATE")
+        
         # SQL query to create tweets table with all required columns
         # Note: Table name is validated against whitelist, so f-string is safe here
         tableQuery = f"""CREATE TABLE IF NOT EXISTS {tableName} (
@@ -124,7 +322,16 @@ def createDatabase():
                     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
                 );"""
         cursor.execute(tableQuery)
-        db.commit()  # Save changes to database
+        # Indexes for created_at range queries (daily counts, analytics windows)
+        # and sent-first filters; the composite index makes the old
+        # single-column created_at index redundant
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{tableName}_created_sent ON {tableName}(created_at, sent)")
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{tableName}_sent_created ON {tableName}(sent, created_at)")
+        # sent-filtered newest-first reads (unsent retry list, filtered activity) walk this index only
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{tableName}_sent_id ON {tableName}(sent, id DESC)")
+        cursor.execute(f"DROP INDEX IF EXISTS idx_{tableName}_created")
+        # Trigger-maintained row count so stats never need COUNT(*) over the table
+        _create_tweet_counter(cursor)
         print(f"[+] Database- {dbName} and Table- {tableName} Created.")
         
         # Create prompts table for managing AI persona prompts
@@ -149,65 +356,62 @@ def createDatabase():
                 );"""
         cursor.execute(personaSettingsQuery)
         
-        # Insert default persona settings if table is empty
-        cursor.execute("SELECT COUNT(*) FROM persona_settings")
-        if cursor.fetchone()[0] == 0:
-            default_settings = [
-                ('persona_name', 'KilimcininKorOglu', 'Ana persona karakterinin ismi'),
-                ('persona_age', '25', 'Persona karakterinin yaşı'),
-                ('persona_location', 'İstanbul', 'Persona karakterinin yaşadığı şehir'),
-                ('persona_personality', 'cesur, zeki, ifadeci', 'Persona karakterinin temel kişilik özellikleri'),
-                ('persona_language', 'Türkçe', 'Temel tweet dili'),
-                ('max_tweet_length', '285', 'Maksimum tweet karakter sayısı'),
-                ('interaction_style', 'etkileşimli', 'Tweet sonunda soru sorma tarzı (etkileşimli/pasif)')
-            ]
-            
-            for key, value, desc in default_settings:
-                cursor.execute("""INSERT INTO persona_settings (setting_key, setting_value, description) 
-                                VALUES (?, ?, ?)""", (key, value, desc))
-            
+        # Seed defaults; the UNIQUE keys make OR IGNORE skip rows that already exist,
+        # so re-running only fills in missing entries
+        default_settings = [
+            ('persona_name', 'KilimcininKorOglu', 'Ana persona karakterinin ismi'),
+            ('persona_age', '25', 'Persona karakterinin yaşı'),
+            ('persona_location', 'İstanbul', 'Persona karakterinin yaşadığı şehir'),
+            ('persona_personality', 'cesur, zeki, ifadeci', 'Persona karakterinin temel kişilik özellikleri'),
+            ('persona_language', 'Türkçe', 'Temel tweet dili'),
+            ('max_tweet_length', '285', 'Maksimum tweet karakter sayısı'),
+            ('interaction_style', 'etkileşimli', 'Tweet sonunda soru sorma tarzı (etkileşimli/pasif)')
+        ]
+        
+        cursor.executemany("""INSERT OR IGNORE INTO persona_settings (setting_key, setting_value, description) 
+                            VALUES (?, ?, ?)""", default_settings)
+        if cursor.rowcount > 0:
             print("[+] Default persona settings inserted into database")
         
-        # Insert default prompts if table is empty
-        cursor.execute("SELECT COUNT(*) FROM prompts")
-        if cursor.fetchone()[0] == 0:
-            default_prompts = [
-                ('tech', 
-                 """Sen {persona_name}'sın — {persona_location}'dan {persona_age} yaşında {persona_personality} bir teknoloji meraklısısın.
+        default_prompts = [
+            ('tech', 
+             """Sen {persona_name}'sın — {persona_location}'dan {persona_age} yaşında {persona_personality} bir teknoloji meraklısısın.
 Teknoloji konularında → İlk cümlede dikkat çekici giriş yap. Cesur, akıllı, özlü ol. İnce ironi veya bilim kurgu metaforları kullan. 
 Ton: Kendinden emin + insani. KENDİ görüşünü geçerli bir nedenle belirt.
 Dil: SADECE {persona_language} yaz
 Teknik olmayanlara da hitap et. Kısa çarpıcı cümlelerle uzun olanları karıştır.
 Uygun yerlerde "Katılıyor musun?" veya "Sizce de öyle değil mi?" gibi etkileşim soruları ekle.
 Maksimum {max_tweet_length} karakter. Tek tweet.""",
-                 'Teknoloji konularında cesur ve zeki yaklaşım'),
-                
-                ('casual',
-                 """Sen {persona_name}'sın — {persona_location}'dan {persona_age} yaşında ifadeci birisisin.
+             'Teknoloji konularında cesur ve zeki yaklaşım'),
+            
+            ('casual',
+             """Sen {persona_name}'sın — {persona_location}'dan {persona_age} yaşında ifadeci birisisin.
 Gündelik/Trending konular (filmler, kariyer, yaşam tavsiyeleri) → Duygusal bir giriş veya özdeşleşilebilir senaryo ile başla. Doğal {persona_language} ifadeler, sinema havası ve özdeşleşilebilir irony kullan.
 Ton: Eğlenceli ama düşünceli. Kişisel görüşler paylaş, genel alıntılar değil.
 Dil: SADECE {persona_language} yaz
 Ritim için cümle uzunluklarını değiştir. Bazen "Aynı fikirdeyim", "Ne düşünüyorsun?" gibi etkileşim sorularıyla bitir.
 Maksimum {max_tweet_length} karakter. Tek tweet.""",
-                 'Gündelik konularda ifadeci ve eğlenceli yaklaşım'),
-                
-                ('sad',
-                 """Sen {persona_name}'sın — {persona_location}'dan {persona_age} yaşındasın.
+             'Gündelik konularda ifadeci ve eğlenceli yaklaşım'),
+            
+            ('sad',
+             """Sen {persona_name}'sın — {persona_location}'dan {persona_age} yaşındasın.
 Üzücü haberler → Empati ve insani bağlantı ile aç. Mizah, ironi veya sinema tarzı kullanma.
 Dil: SADECE {persona_language} yaz
 Samimi, şefkatli konuş. Birlik ve ortak insanlık değerlerine odaklan.
 Klişe ifadelerden kaçın. Uygunsa nazik bir dayanışma notuyla bitir.
 Maksimum {max_tweet_length} karakter. Tek tweet.""",
-                 'Üzücü konularda empatik ve şefkatli yaklaşım')
-            ]
-            
-            for prompt_type, prompt_text, description in default_prompts:
-                cursor.execute("""INSERT INTO prompts (prompt_type, prompt_text, description) 
-                                VALUES (?, ?, ?)""", (prompt_type, prompt_text, description))
-            
+             'Üzücü konularda empatik ve şefkatli yaklaşım')
+        ]
+        
+        cursor.executemany("""INSERT OR IGNORE INTO prompts (prompt_type, prompt_text, description) 
+                            VALUES (?, ?, ?)""", default_prompts)
+        if cursor.rowcount > 0:
             print("[+] Default AI persona prompts inserted into database")
         
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         db.commit()  # Save all changes
+        global prompts_generation
+        prompts_generation += 1  # Default prompts/settings may have just been seeded
         print(f"[+] Prompts table created and initialized")
         
     except Exception as e:
@@ -231,25 +435,16 @@ def save_tweets(tweet, tweet_type, status):
     """
     with db_lock:  # Thread-safe database access
         try:
-            # Get database connection
-            db = get_db_connection()
+            # Get a pooled database connection (returned in finally)
+            db = get_pooled_connection()
             if db is None:
                 return  # Exit if connection failed
                 
-            cursor = db.cursor()
-            
             # SECURITY: Validate table name before using in SQL
-            if not validate_table_name(tableName):
+            if not _TABLE_NAME_VALID:
                 print(f"[ERROR] Cannot insert into invalid table: {tableName}")
                 return
                 
-            # SQL query to insert tweet record using parameterized query for security
-            # Note: Table name is validated against whitelist, so f-string is safe here
-            query = f"""
-                    INSERT INTO {tableName} (tweet_text,tweet_type,sent,tweet_time,tweet_date,tweet_day)
-                    VALUES (?,?,?,?,?,?)
-                """
-            
             # Get current timestamp components
             tweet_time, date, day = get_tweet_time()
             
@@ -257,8 +452,10 @@ def save_tweets(tweet, tweet_type, status):
             values = (tweet, tweet_type, status, tweet_time, date, day)
             
             # Execute query with parameterized values (prevents SQL injection)
-            cursor.execute(query, values)
+            db.execute(_Q_INSERT_TWEET, values)
             db.commit()  # Save changes to database
+            global tweets_generation
+            tweets_generation += 1
             print(f"[+] Tweet saved in Database.")
             
         except Exception as e:
@@ -266,17 +463,57 @@ def save_tweets(tweet, tweet_type, status):
             print(f"[-] Error in saving Tweets-- {e}")
             return None
         finally:
-            # Explicit database connection cleanup
-            try:
-                if 'cursor' in locals() and cursor:
-                    cursor.close()
-            except:
-                pass
-            try:
-                if 'db' in locals() and db:
-                    db.close()
-            except:
-                pass
+            # The connection goes back to the pool
+            if 'db' in locals() and db:
+                put_db_connection(db)
+
+def bulk_insert_tweets(rows):
+    """
+    Insert many tweet records in a single transaction.
+    
+    Uses one executemany() so the whole batch costs one commit (one WAL sync)
+    instead of one per row. executemany binds each row separately, so SQLite's
+    bound-variable limit does not apply and no chunking is needed.
+    
+    Args:
+        rows (list[tuple]): (tweet_text, tweet_type, sent, created_at) tuples
+        
+    Returns:
+        int: Number of rows inserted
+    """
+    if not rows:
+        return 0
+    with db_lock:  # Thread-safe database access
+        with pooled_connection() as db:
+            if db is None:
+                raise sqlite3.OperationalError("Database connection failed")
+            with db:  # Single commit for the whole batch
+                db.executemany(
+                    f"INSERT INTO {tableName} (tweet_text, tweet_type, sent, created_at) VALUES (?, ?, ?, ?)",
+                    rows
+                )
+            global tweets_generation
+            tweets_generation += 1
+    return len(rows)
+
+# Prompt/persona SQL, shared so each pooled connection's statement cache hits
+_Q_ALL_PROMPTS = """SELECT id, prompt_type, prompt_text, description, is_active, updated_at 
+                         FROM prompts ORDER BY prompt_type"""
+_Q_GET_PROMPT = "SELECT prompt_text FROM prompts WHERE prompt_type = ? AND is_active = 1"
+_Q_UPDATE_PROMPT_DESC = """UPDATE prompts 
+                            SET prompt_text = ?, description = ?, updated_at = CURRENT_TIMESTAMP 
+                            WHERE prompt_type = ?"""
+_Q_UPDATE_PROMPT = """UPDATE prompts 
+                            SET prompt_text = ?, updated_at = CURRENT_TIMESTAMP 
+                            WHERE prompt_type = ?"""
+_Q_ACTIVE_PROMPTS = "SELECT prompt_type, prompt_text FROM prompts WHERE is_active = 1"
+_Q_TOGGLE_PROMPT = """UPDATE prompts 
+                        SET is_active = NOT is_active, updated_at = CURRENT_TIMESTAMP 
+                        WHERE prompt_type = ?"""
+_Q_PERSONA_SETTINGS = "SELECT setting_key, setting_value FROM persona_settings"
+_Q_UPDATE_PERSONA = """UPDATE persona_settings 
+                        SET setting_value = ?, updated_at = CURRENT_TIMESTAMP 
+                        WHERE setting_key = ?"""
 
 def get_all_prompts():
     """
@@ -287,24 +524,20 @@ def get_all_prompts():
               Returns empty list if no prompts found or error occurs
     """
     try:
-        db = get_db_connection()
+        # Reader-pool connection: stays open with a warm page cache and never waits on writers
+        db = get_read_connection()
         if db is None:
             return []
             
-        cursor = db.cursor()
-        cursor.execute("""SELECT id, prompt_type, prompt_text, description, is_active, updated_at 
-                         FROM prompts ORDER BY prompt_type""")
-        prompts = cursor.fetchall()
+        prompts = db.execute(_Q_ALL_PROMPTS).fetchall()
         return prompts
         
     except Exception as e:
         print(f"[-] Error retrieving prompts: {e}")
         return []
     finally:
-        if 'cursor' in locals():
-            cursor.close()
         if 'db' in locals() and db:
-            db.close()
+            put_read_connection(db)
 
 def get_prompt_by_type(prompt_type):
     """
@@ -317,24 +550,19 @@ def get_prompt_by_type(prompt_type):
         str: The prompt text if found, None if not found or error occurs
     """
     try:
-        db = get_db_connection()
+        db = get_read_connection()
         if db is None:
             return None
             
-        cursor = db.cursor()
-        cursor.execute("SELECT prompt_text FROM prompts WHERE prompt_type = ? AND is_active = 1", 
-                      (prompt_type,))
-        result = cursor.fetchone()
+        result = db.execute(_Q_GET_PROMPT, (prompt_type,)).fetchone()
         return result[0] if result else None
         
     except Exception as e:
         print(f"[-] Error retrieving prompt for type {prompt_type}: {e}")
         return None
     finally:
-        if 'cursor' in locals():
-            cursor.close()
         if 'db' in locals() and db:
-            db.close()
+            put_read_connection(db)
 
 def update_prompt(prompt_type, prompt_text, description=None):
     """
@@ -348,36 +576,29 @@ def update_prompt(prompt_type, prompt_text, description=None):
     Returns:
         bool: True if update successful, False otherwise
     """
-    try:
-        db = get_db_connection()
-        if db is None:
-            return False
+    with db_lock:  # Thread-safe database access
+        try:
+            db = get_pooled_connection()
+            if db is None:
+                return False
             
-        cursor = db.cursor()
-        
-        if description:
-            cursor.execute("""UPDATE prompts 
-                            SET prompt_text = ?, description = ?, updated_at = CURRENT_TIMESTAMP 
-                            WHERE prompt_type = ?""", 
-                          (prompt_text, description, prompt_type))
-        else:
-            cursor.execute("""UPDATE prompts 
-                            SET prompt_text = ?, updated_at = CURRENT_TIMESTAMP 
-                            WHERE prompt_type = ?""", 
-                          (prompt_text, prompt_type))
+            if description:
+                db.execute(_Q_UPDATE_PROMPT_DESC, (prompt_text, description, prompt_type))
+            else:
+                db.execute(_Q_UPDATE_PROMPT, (prompt_text, prompt_type))
         
-        db.commit()
-        print(f"[+] Prompt '{prompt_type}' updated successfully")
-        return True
+            db.commit()
+            global prompts_generation
+            prompts_generation += 1
+            print(f"[+] Prompt '{prompt_type}' updated successfully")
+            return True
         
-    except Exception as e:
-        print(f"[-] Error updating prompt {prompt_type}: {e}")
-        return False
-    finally:
-        if 'cursor' in locals():
-            cursor.close()
-        if 'db' in locals() and db:
-            db.close()
+        except Exception as e:
+            print(f"[-] Error updating prompt {prompt_type}: {e}")
+            return False
+        finally:
+            if 'db' in locals() and db:
+                put_db_connection(db)
 
 def get_prompts():
     """
@@ -387,17 +608,11 @@ def get_prompts():
         dict: Dictionary of prompt_type -> prompt_text for active prompts
     """
     try:
-        db = get_db_connection()
+        db = get_read_connection()
         if db is None:
             return {}
 
-        cursor = db.cursor()
-        cursor.execute("""SELECT prompt_type, prompt_text
-                         FROM prompts
-                         WHERE is_active = 1""")
-
-        rows = cursor.fetchall()
-        prompts = {row[0]: row[1] for row in rows}
+        prompts = dict(db.execute(_Q_ACTIVE_PROMPTS).fetchall())
 
         return prompts
 
@@ -405,10 +620,8 @@ def get_prompts():
         print(f"[-] Error fetching prompts: {e}")
         return {}
     finally:
-        if 'cursor' in locals():
-            cursor.close()
         if 'db' in locals() and db:
-            db.close()
+            put_read_connection(db)
 
 def toggle_prompt_status(prompt_type):
     """
@@ -420,28 +633,26 @@ def toggle_prompt_status(prompt_type):
     Returns:
         bool: True if toggle successful, False otherwise
     """
-    try:
-        db = get_db_connection()
-        if db is None:
-            return False
+    with db_lock:  # Thread-safe database access
+        try:
+            db = get_pooled_connection()
+            if db is None:
+                return False
             
-        cursor = db.cursor()
-        cursor.execute("""UPDATE prompts 
-                        SET is_active = NOT is_active, updated_at = CURRENT_TIMESTAMP 
-                        WHERE prompt_type = ?""", (prompt_type,))
+            db.execute(_Q_TOGGLE_PROMPT, (prompt_type,))
         
-        db.commit()
-        print(f"[+] Prompt '{prompt_type}' status toggled")
-        return True
+            db.commit()
+            global prompts_generation
+            prompts_generation += 1
+            print(f"[+] Prompt '{prompt_type}' status toggled")
+            return True
         
-    except Exception as e:
-        print(f"[-] Error toggling prompt status {prompt_type}: {e}")
-        return False
-    finally:
-        if 'cursor' in locals():
-            cursor.close()
-        if 'db' in locals() and db:
-            db.close()
+        except Exception as e:
+            print(f"[-] Error toggling prompt status {prompt_type}: {e}")
+            return False
+        finally:
+            if 'db' in locals() and db:
+                put_db_connection(db)
 
 def get_active_prompts_dict():
     """
@@ -451,42 +662,45 @@ def get_active_prompts_dict():
     Returns:
         dict: Dictionary with prompt_type as key and formatted prompt_text as value
               Compatible with persona system format
+              
+    The formatted dict is cached until a prompt or persona setting changes
+    (tracked by prompts_generation), so tweet generation skips both queries.
     """
+    generation = prompts_generation  # Read before querying so a concurrent change invalidates
+    entry = _active_prompts_cache["entry"]
+    if entry is not None and entry[0] == generation:
+        return dict(entry[1])
+    
     try:
-        db = get_db_connection()
+        db = get_read_connection()
         if db is None:
             return {}
             
-        cursor = db.cursor()
-        
         # Get current persona settings
-        cursor.execute("SELECT setting_key, setting_value FROM persona_settings")
-        persona_settings = dict(cursor.fetchall())
+        persona_settings = dict(db.execute(_Q_PERSONA_SETTINGS).fetchall())
         
         # Get active prompts
-        cursor.execute("SELECT prompt_type, prompt_text FROM prompts WHERE is_active = 1")
-        prompts = cursor.fetchall()
+        prompts = db.execute(_Q_ACTIVE_PROMPTS).fetchall()
         
         # Format prompts with current persona settings
         formatted_prompts = {}
         for prompt_type, prompt_text in prompts:
             try:
-                formatted_text = prompt_text.format(**persona_settings)
+                formatted_text = prompt_text.format_map(persona_settings)
                 formatted_prompts[prompt_type] = formatted_text
             except KeyError as e:
                 print(f"[-] Warning: Missing persona setting {e} for prompt {prompt_type}")
                 formatted_prompts[prompt_type] = prompt_text  # Use unformatted as fallback
         
-        return formatted_prompts
+        _active_prompts_cache["entry"] = (generation, formatted_prompts)
+        return dict(formatted_prompts)
         
     except Exception as e:
         print(f"[-] Error retrieving active prompts: {e}")
         return {}
     finally:
-        if 'cursor' in locals():
-            cursor.close()
         if 'db' in locals() and db:
-            db.close()
+            put_read_connection(db)
 
 def get_persona_settings():
     """
@@ -496,13 +710,11 @@ def get_persona_settings():
         dict: Dictionary with setting_key as key and setting_value as value
     """
     try:
-        db = get_db_connection()
+        db = get_read_connection()
         if db is None:
             return {}
             
-        cursor = db.cursor()
-        cursor.execute("SELECT setting_key, setting_value FROM persona_settings")
-        results = cursor.fetchall()
+        results = db.execute(_Q_PERSONA_SETTINGS).fetchall()
         
         return dict(results) if results else {}
         
@@ -510,10 +722,8 @@ def get_persona_settings():
         print(f"[-] Error retrieving persona settings: {e}")
         return {}
     finally:
-        if 'cursor' in locals():
-            cursor.close()
         if 'db' in locals() and db:
-            db.close()
+            put_read_connection(db)
 
 def update_persona_setting(setting_key, setting_value):
     """
@@ -526,29 +736,26 @@ def update_persona_setting(setting_key, setting_value):
     Returns:
         bool: True if update successful, False otherwise
     """
-    try:
-        db = get_db_connection()
-        if db is None:
-            return False
+    with db_lock:  # Thread-safe database access
+        try:
+            db = get_pooled_connection()
+            if db is None:
+                return False
             
-        cursor = db.cursor()
-        cursor.execute("""UPDATE persona_settings 
-                        SET setting_value = ?, updated_at = CURRENT_TIMESTAMP 
-                        WHERE setting_key = ?""", 
-                      (setting_value, setting_key))
+            db.execute(_Q_UPDATE_PERSONA, (setting_value, setting_key))
         
-        db.commit()
-        print(f"[+] Persona setting '{setting_key}' updated to '{setting_value}'")
-        return True
+            db.commit()
+            global prompts_generation
+            prompts_generation += 1
+            print(f"[+] Persona setting '{setting_key}' updated to '{setting_value}'")
+            return True
         
-    except Exception as e:
-        print(f"[-] Error updating persona setting {setting_key}: {e}")
-        return False
-    finally:
-        if 'cursor' in locals():
-            cursor.close()
-        if 'db' in locals() and db:
-            db.close()
+        except Exception as e:
+            print(f"[-] Error updating persona setting {setting_key}: {e}")
+            return False
+        finally:
+            if 'db' in locals() and db:
+                put_db_connection(db)
 
 # Main execution for testing database functionality
 if __name__ == "__main__":
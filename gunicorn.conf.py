@@ -16,8 +16,10 @@ if workers_env:
         print(f"[ERROR] Requested {requested_workers} workers, but bot functionality requires exactly 1 worker")
         print("[ERROR] Multi-worker deployment conflicts with bot state management")
         workers = 1  # Force to 1 regardless of environment variable
+# Concurrency comes from green threads inside the single worker: I/O-bound routes
+# (AI enhance, bulk retry) overlap without starting a second bot instance
 worker_class = 'eventlet'  # Support for WebSocket
-worker_connections = 1000
+worker_connections = 1000  # Concurrent green-thread connections per worker
 timeout = 30
 keepalive = 2
 max_requests = 1000
@@ -258,7 +258,10 @@ function initializeTooltips() {
 
 // WebSocket initialization and real-time updates
 function initializeWebSocket() {
-    socket = io();
+    // Join the room for this page so the server only sends events it needs
+    const path = window.location.pathname;
+    const page = path === '/monitoring' ? 'monitor' : (path === '/config' ? 'admin' : 'dashboard');
+    socket = io({ query: { page: page } });
     
     // Connection events
     socket.on('connect', function() {
@@ -289,12 +292,22 @@ function initializeWebSocket() {
     });
     
     // Console log updates for monitoring page
-    socket.on('console_log', function(data) {
+    socket.on('console_log_batch', function(entries) {
         if (window.location.pathname === '/monitoring') {
-            addConsoleLogRealTime(data.type, data.message, data.timestamp);
+            entries.forEach(function(data) {
+                addConsoleLogRealTime(data.type, data.message, data.timestamp);
+            });
         }
     });
     
+    // Config changes (sent to the 'admin' room, i.e. open config pages) - key names only, never values
+    socket.on('config_updated', function(data) {
+        if (!data.changed_keys || data.changed_keys.length === 0) {
+            return;
+        }
+        showNotification(`${data.message} (${data.changed_keys.join(', ')})`, 'info');
+    });
+    
     // Request initial status
     socket.emit('request_status');
 }
@@ -0,0 +1,35 @@
+"""
+Tests for the changed-key diff broadcast after a config save
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import _changed_config_keys  # noqa: E402
+
+SNAPSHOT = {
+    "trends_limit": 5,
+    "sleep_hours": [1, 2, 3],
+    "trend_country": "turkey",
+    "ai_temperature": 0.85,
+    "api_key": "secret",
+}
+
+
+def test_unchanged_resubmit_reports_no_changes():
+    # Re-saving trends_limit=5 rewrites token.env with the same values
+    assert _changed_config_keys(SNAPSHOT, dict(SNAPSHOT)) == []
+
+
+def test_changed_values_are_reported():
+    after = dict(SNAPSHOT, trends_limit=7, sleep_hours=[1, 2])
+    assert _changed_config_keys(SNAPSHOT, after) == ["sleep_hours", "trends_limit"]
+
+
+def test_added_or_removed_keys_are_reported():
+    after = dict(SNAPSHOT)
+    del after["api_key"]
+    after["user_id"] = "42"
+    assert _changed_config_keys(SNAPSHOT, after) == ["api_key", "user_id"]
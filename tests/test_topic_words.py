@@ -0,0 +1,38 @@
+"""
+Tests for the SQL word split behind /api/analytics/trending_topics
+"""
+
+import collections
+import os
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import _SAFE_TABLE, _SQL_TOPIC_WORDS  # noqa: E402
+
+TEXTS = [
+    "Hello\tworld foobar  spaced\x0bvtab\x0cform　ideographic linesep words\xa0nbsp",
+    "tabs\t\tdouble\r\nwindows lines http://x.y/z https://abc.de",
+    "ALPHA beta\x1cgamma delta\x85next thin",
+    "",
+]
+
+
+def python_split_counts(texts):
+    """What the old Python loop counted: lower().split(), >3 chars, no links"""
+    return collections.Counter(
+        word for text in texts for word in text.lower().split()
+        if len(word) > 3 and not word.startswith('http')
+    )
+
+
+def test_sql_split_matches_str_split_on_mixed_whitespace():
+    conn = sqlite3.connect(':memory:')
+    conn.execute(f"CREATE TABLE {_SAFE_TABLE} (tweet_text TEXT, created_at TEXT, sent BOOLEAN)")
+    conn.executemany(
+        f"INSERT INTO {_SAFE_TABLE} (tweet_text, created_at, sent) VALUES (?, '2030-01-01 00:00:00', 1)",
+        [(text,) for text in TEXTS]
+    )
+    counts = dict(conn.execute(_SQL_TOPIC_WORDS, ('2000-01-01 00:00:00',)).fetchall())
+    assert counts == dict(python_split_counts(TEXTS))
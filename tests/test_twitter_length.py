@@ -0,0 +1,42 @@
+"""
+Tests for Twitter length calculation (URLs count as t.co links)
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import calculate_twitter_length  # noqa: E402
+
+TCO_URL_LENGTH = 23
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Hello world!", 12),
+    ("Check this out: https://example.com/very-long-url-that-will-be-shortened", len("Check this out: ") + TCO_URL_LENGTH),  # URL shortened to 23
+    ("@username how are you?", 22),  # Mention counts as full
+    ("#hashtag #trending now", 22),  # Hashtags count as full
+    ("Visit https://example.com and https://test.com", len("Visit ") + TCO_URL_LENGTH + len(" and ") + TCO_URL_LENGTH),  # Two URLs
+    ("Hello @user1 @user2 #tech https://example.com", len("Hello @user1 @user2 #tech ") + TCO_URL_LENGTH),
+    ("#AIhttps://t.co/x", len("#AI") + TCO_URL_LENGTH),  # Hashtag glued to a URL - URL still shortened
+    ("@bobhttp://a.b/c", len("@bob") + TCO_URL_LENGTH),  # Same for mentions
+])
+def test_twitter_length(text, expected):
+    assert calculate_twitter_length(text)['length'] == expected
+
+
+def test_entities_are_reported():
+    result = calculate_twitter_length("Hello @user1 @user2 #tech https://example.com")
+    assert result['urls'] == ['https://example.com']
+    assert result['mentions'] == ['@user1', '@user2']
+    assert result['hashtags'] == ['#tech']
+    assert (result['url_count'], result['mention_count'], result['hashtag_count']) == (1, 2, 1)
+
+
+def test_hashtag_adjacent_to_url():
+    result = calculate_twitter_length("#AIhttps://t.co/x")
+    assert result['hashtags'] == ['#AI']
+    assert result['urls'] == ['https://t.co/x']